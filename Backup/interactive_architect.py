@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import ezdxf
+import shapely
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button
 import matplotlib.patches as patches
-from shapely.geometry import Polygon, Point, LineString
-from shapely.ops import unary_union
+from shapely.geometry import Polygon, LineString
 import numpy as np
+from scipy import ndimage
 
 class InteractiveArchitectPlan:
     def __init__(self):
@@ -17,6 +21,9 @@ class InteractiveArchitectPlan:
         self.current_floor = 0
         self.zoom_level = 1.0
         
+        # Threads for geometry queries; batch runs split the cores between files
+        self.geometry_workers = os.cpu_count() or 1
+        
     def parse_architectural_elements(self, dxf_path):
         """Parse DXF into proper architectural elements"""
         doc = ezdxf.readfile(dxf_path)
@@ -29,15 +36,15 @@ class InteractiveArchitectPlan:
             layer = entity.dxf.layer.upper()
             
             if entity.dxftype() == 'LWPOLYLINE':
-                points = [(p[0], p[1]) for p in entity.get_points()]
+                pts = np.asarray(entity.get_points('xy'), dtype=np.float64)
                 
                 if 'WALL' in layer or layer == 'P':
-                    walls.append(LineString(points))
+                    walls.append(LineString(pts))
                 elif 'ROOM' in layer or 'SPACE' in layer:
-                    if len(points) >= 3:
-                        room_boundaries.append(Polygon(points))
+                    if pts.shape[0] >= 3:
+                        room_boundaries.append(Polygon(pts))
                 elif 'STAIR' in layer:
-                    self.stairs.append({'geometry': Polygon(points), 'floor': 0})
+                    self.stairs.append({'geometry': Polygon(pts), 'floor': 0})
         
         # Auto-detect rooms from wall intersections
         self._detect_rooms_from_walls(walls)
@@ -47,31 +54,50 @@ class InteractiveArchitectPlan:
     def _detect_rooms_from_walls(self, walls):
         """Detect rooms from wall network"""
         # Simplified room detection - find enclosed areas
-        wall_union = unary_union(walls)
+        wall_union = shapely.union_all(walls)
+        # Build the GEOS index once before workers share the geometry
+        shapely.prepare(wall_union)
         
         # Create grid points and test which are enclosed
         bounds = wall_union.bounds
         x_range = np.linspace(bounds[0], bounds[2], 50)
         y_range = np.linspace(bounds[1], bounds[3], 50)
         
-        room_id = 0
-        for x in x_range[::5]:
-            for y in y_range[::5]:
-                pt = Point(x, y)
-                # If point is far from walls, it's likely inside a room
-                if wall_union.distance(pt) > 2:
-                    self.rooms[f"Room_{room_id}"] = {
-                        'center': (x, y),
-                        'type': 'general',
-                        'floor': 0,
-                        'accessible': True
-                    }
-                    room_id += 1
+        x_probe = x_range[::5]
+        y_probe = y_range[::5]
+        xs, ys = np.meshgrid(x_probe, y_probe, indexing='ij')
+        grid = np.column_stack([xs.ravel(), ys.ravel()])
+        
+        # GEOS releases the GIL, so each worker measures its own slice
+        workers = self.geometry_workers
+        batches = np.array_split(grid, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            distances = np.concatenate(list(pool.map(
+                lambda batch: shapely.distance(wall_union, shapely.points(batch)),
+                batches
+            )))
+        
+        # Points far from walls are likely inside a room; connected probe
+        # cells belong to the same room, so emit one record per component
+        inside = (distances > 2).reshape(xs.shape)
+        labels, n_rooms = ndimage.label(inside)
+        
+        for k in range(1, n_rooms + 1):
+            ii, jj = np.nonzero(labels == k)
+            self.rooms[f"Room_{k}"] = {
+                'center': (x_probe[ii].mean(), y_probe[jj].mean()),
+                'type': 'general',
+                'floor': 0,
+                'accessible': True
+            }
     
-    def create_interactive_plan(self, dxf_path, output_path):
+    def create_interactive_plan(self, dxf_path, output_path, show=True):
         """Create interactive architectural plan"""
         walls, room_boundaries = self.parse_architectural_elements(dxf_path)
-        
+        return self._render_plan(walls, output_path, show)
+    
+    def _render_plan(self, walls, output_path, show=True):
+        """Render parsed elements to the output image"""
         fig, ax = plt.subplots(figsize=(16, 12))
         
         # Draw walls as thick lines
@@ -117,9 +143,16 @@ class InteractiveArchitectPlan:
         fig.canvas.mpl_connect('pick_event', self._on_click)
         fig.canvas.mpl_connect('scroll_event', self._on_scroll)
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=300, bbox_inches='tight')
+        
+        if show:
+            plt.show()
+        else:
+            # Drop artists and unregister the figure so batch runs stay flat
+            ax.cla()
+            fig.clf()
+            plt.close(fig)
         
         return output_path
     
@@ -186,10 +219,39 @@ class InteractiveArchitectPlan:
         print(f"Switched to floor: {self.current_floor}")
         # Implement floor switching logic
 
-def create_interactive_plan(dxf_path, output_path):
+def create_interactive_plan(dxf_path, output_path, show=True):
     """Main function to create interactive architectural plan"""
     architect = InteractiveArchitectPlan()
-    return architect.create_interactive_plan(dxf_path, output_path)
+    return architect.create_interactive_plan(dxf_path, output_path, show)
+
+def create_interactive_plans(jobs, max_workers=None):
+    """Create plans for a list of (dxf_path, output_path) pairs.
+    
+    Parsing and geometry run on a thread pool since Shapely releases the GIL;
+    rendering stays on the calling thread because pyplot is not thread-safe.
+    """
+    jobs = list(jobs)
+    architects = [InteractiveArchitectPlan() for _ in jobs]
+    
+    # Each file task runs its own geometry pool; share the cores between them
+    # rather than nesting a full-size pool in every task
+    cpus = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = min(32, cpus + 4)
+    max_workers = max(1, min(max_workers, len(jobs)))
+    for architect in architects:
+        architect.geometry_workers = max(1, cpus // max_workers)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        parsed = list(pool.map(
+            lambda architect, job: architect.parse_architectural_elements(job[0]),
+            architects, jobs
+        ))
+    
+    return [
+        architect._render_plan(walls, output_path, show=False)
+        for architect, (walls, _), (_, output_path) in zip(architects, parsed, jobs)
+    ]
 
 if __name__ == "__main__":
     dxf_file = r"C:\Users\HP\Desktop\FLOORPLAN_GENIE\input_files\ovo DOSSIER COSTO - plan rdc rdj - cota.dxf"
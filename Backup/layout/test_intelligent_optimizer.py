@@ -0,0 +1,20 @@
+import shapely
+from shapely.geometry import box, LineString
+
+from intelligent_optimizer import IntelligentIlotOptimizer
+
+
+def test_slanted_wall_keeps_clearance():
+    """Free rectangles and placed îlots stay clear of a slanted wall"""
+    wall = LineString([(5, 5), (35, 20)])
+    walls = {'lines': [wall]}
+    optimizer = IntelligentIlotOptimizer()
+
+    optimizer._load_obstacles(walls, None)
+    free_rects = optimizer._decompose_free_rectangles(box(0, 0, 40, 30), walls, None)
+    assert len(free_rects)
+    assert (shapely.distance(shapely.box(*free_rects.T), wall) >= optimizer.wall_clearance - 1e-6).all()
+
+    result = optimizer.optimize_intelligent_layout(box(0, 0, 40, 30), None, 1.2, 'maximum', walls, None)
+    assert result['islands']
+    assert all(island.distance(wall) >= optimizer.wall_clearance - 1e-6 for island in result['islands'])
@@ -1,19 +1,30 @@
-import pdfplumber
-import cv2
 import numpy as np
-from PIL import Image
-import io
-from shapely.geometry import LineString, Polygon
-from skimage import measure, morphology
-from scipy import ndimage
+import os
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# cv2 and pdfplumber are imported where they are used so loading this module stays cheap
+
+# Rendered page rasters, keyed by PDF content hash, page number and DPI
+RASTER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'floorplan_genie')
+# Least recently used rasters beyond this many pages are evicted
+RASTER_CACHE_MAX_PAGES = 500
 
 class PDFParser:
     def __init__(self):
         self.dpi = 300
+        self.detection_dpi = 150
         self.scale_factor = 1.0
         
-    def parse_pdf(self, file_path):
+        # Scratch buffers reused across pages of the same size
+        self._gray_buf = None
+        self._edges_buf = None
+        
+    def parse_pdf(self, file_path, force_refresh=False):
         """Advanced PDF parsing with multi-sheet support and element detection"""
+        import pdfplumber
+        
         print(f"Parsing PDF file: {file_path}")
         
         classified_entities = {
@@ -28,31 +39,115 @@ class PDFParser:
         
         try:
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    print(f"Processing page {page_num + 1}/{len(pdf.pages)}")
-                    
-                    # Extract vector graphics first
-                    vector_entities = self._extract_vector_graphics(page)
-                    
-                    # Convert page to image for raster analysis
-                    page_image = page.to_image(resolution=self.dpi)
-                    img_array = np.array(page_image.original)
-                    
-                    # Extract raster elements
-                    raster_entities = self._extract_raster_elements(img_array)
-                    
-                    # Combine and classify
-                    page_entities = self._merge_and_classify(vector_entities, raster_entities)
-                    
-                    # Add to main collection
-                    for category, entities in page_entities.items():
-                        classified_entities[category].extend(entities)
+                page_count = len(pdf.pages)
+            
+            file_hash = self._hash_file(file_path)
+            
+            # Pages are independent, so rasterization and OpenCV work run in parallel
+            workers = min(os.cpu_count() or 1, 6, page_count)
+            if workers > 1:
+                page_results = [None] * page_count
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    futures = {executor.submit(_process_page, file_path, page_num,
+                                               self.dpi, self.detection_dpi, self.scale_factor,
+                                               file_hash, force_refresh): page_num
+                               for page_num in range(page_count)}
+                    for future in as_completed(futures):
+                        page_results[futures[future]] = future.result()
+            else:
+                with pdfplumber.open(file_path) as pdf:
+                    page_results = [self._process_page(page, page_num, page_count, file_hash, force_refresh)
+                                    for page_num, page in enumerate(pdf.pages)]
+            
+            # Add to main collection in page order
+            for page_entities in page_results:
+                for category, entities in page_entities.items():
+                    classified_entities[category].extend(entities)
                         
         except Exception as e:
             print(f"Error parsing PDF: {e}")
             
         return classified_entities
     
+    def _hash_file(self, file_path):
+        """SHA-1 of the PDF contents, used to key the raster cache"""
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _render_page(self, page, cache_path, force_refresh=False):
+        """Rasterize a page, reusing the cached render of identical PDF content"""
+        import cv2
+        
+        if not force_refresh and os.path.exists(cache_path):
+            cached = cv2.imread(cache_path, cv2.IMREAD_COLOR)
+            if cached is not None:
+                # Eviction goes by mtime, so a hit marks the page as recently used
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                return cv2.cvtColor(cached, cv2.COLOR_BGR2RGB, dst=cached)
+        
+        page_image = page.to_image(resolution=self.dpi).original
+        if page_image.mode != 'RGB':
+            page_image = page_image.convert('RGB')
+        img_array = np.asarray(page_image, dtype=np.uint8)
+        
+        try:
+            os.makedirs(RASTER_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp.png"
+            if cv2.imwrite(tmp_path, cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR),
+                           [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+                os.replace(tmp_path, cache_path)
+                self._prune_raster_cache()
+        except Exception as e:
+            print(f"Could not cache page raster: {e}")
+        
+        return img_array
+    
+    def _prune_raster_cache(self):
+        """Evict the least recently used page rasters beyond the cache limit"""
+        cached = []
+        for entry in os.scandir(RASTER_CACHE_DIR):
+            if not entry.name.endswith('.png') or entry.name.endswith('.tmp.png'):
+                continue
+            # Parallel workers prune the same directory, so entries can vanish
+            try:
+                cached.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+        
+        if len(cached) <= RASTER_CACHE_MAX_PAGES:
+            return
+        
+        cached.sort()
+        for _, path in cached[:len(cached) - RASTER_CACHE_MAX_PAGES]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def _process_page(self, page, page_num, page_count, file_hash, force_refresh=False):
+        """Extract and classify the entities of a single page"""
+        print(f"Processing page {page_num + 1}/{page_count}")
+        
+        # Extract vector graphics first
+        vector_entities = self._extract_vector_graphics(page)
+        
+        # Convert page to image for raster analysis
+        cache_path = os.path.join(RASTER_CACHE_DIR, f"{file_hash}_{page_num}_{self.dpi}.png")
+        img_array = self._render_page(page, cache_path, force_refresh)
+        
+        # Extract raster elements
+        raster_entities = self._extract_raster_elements(img_array)
+        
+        # Combine and classify
+        return self._merge_and_classify(vector_entities, raster_entities)
+    
     def _extract_vector_graphics(self, page):
         """Extract vector graphics from PDF page"""
         entities = []
@@ -85,7 +180,8 @@ class PDFParser:
         # Extract curves (approximate as polylines)
         for curve in page.curves:
             if len(curve['pts']) >= 2:
-                points = [(pt[0], page.height - pt[1]) for pt in curve['pts']]
+                points = np.asarray(curve['pts'], dtype=np.float64)
+                points[:, 1] = page.height - points[:, 1]
                 entities.append({
                     'type': 'LWPOLYLINE',
                     'points': points,
@@ -97,52 +193,100 @@ class PDFParser:
     
     def _extract_raster_elements(self, img_array):
         """Extract elements from rasterized PDF image using computer vision"""
+        import cv2
+        
         entities = []
         
-        # Convert to grayscale
-        if len(img_array.shape) == 3:
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = img_array
-            
+        # Detect on a downsampled copy; lines and regions resolve just as well at lower DPI.
+        # Pixel thresholds are tuned for the page raster, so detectors shrink them by scale
+        scale = max(self.dpi / self.detection_dpi, 1.0)
+        if scale > 1:
+            img_array = cv2.resize(img_array, None, fx=1 / scale, fy=1 / scale,
+                                   interpolation=cv2.INTER_AREA)
+        
+        # Convert to grayscale once; colour segmentation only applies to RGB pages
+        is_color = img_array.ndim == 3
+        if self._gray_buf is None or self._gray_buf.shape != img_array.shape[:2]:
+            self._gray_buf = np.empty(img_array.shape[:2], dtype=np.uint8)
+            self._edges_buf = np.empty(img_array.shape[:2], dtype=np.uint8)
+        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY, dst=self._gray_buf) if is_color else img_array
+        
         # Detect different colored regions
-        entities.extend(self._detect_colored_regions(img_array))
+        if is_color:
+            entities.extend(self._detect_colored_regions(img_array, scale))
+        
+        # Edge map shared by line and circle detection
+        edges = cv2.Canny(gray, 50, 150, edges=self._edges_buf, apertureSize=3)
         
         # Detect lines using Hough transform
-        entities.extend(self._detect_lines(gray))
+        entities.extend(self._detect_lines(edges, scale))
         
         # Detect circular elements (doors/windows)
-        entities.extend(self._detect_circles(gray))
+        entities.extend(self._detect_circles(edges, scale))
+        
+        if scale > 1:
+            self._scale_raster_entities(entities, scale)
         
         return entities
     
-    def _detect_colored_regions(self, img_array):
+    def _scale_raster_entities(self, entities, scale):
+        """Map detection-resolution pixel coordinates back to page-raster pixels"""
+        for entity in entities:
+            if 'start' in entity:
+                entity['start'] = (entity['start'][0] * scale, entity['start'][1] * scale)
+                entity['end'] = (entity['end'][0] * scale, entity['end'][1] * scale)
+            if 'center' in entity:
+                entity['center'] = (entity['center'][0] * scale, entity['center'][1] * scale)
+                entity['radius'] = entity['radius'] * scale
+            if 'paths' in entity:
+                entity['paths'] = [[(x * scale, y * scale) for x, y in path]
+                                   for path in entity['paths']]
+    
+    def _detect_colored_regions(self, img_array, scale=1.0):
         """Detect colored regions that might represent restricted zones or entrances"""
+        import cv2
+        
         entities = []
+        min_area = 100 / scale ** 2
         
-        if len(img_array.shape) != 3:
-            return entities
-            
-        # Define color ranges for different elements
+        # HSV bands for different elements (OpenCV hue is 0-179, so red wraps around 0)
         color_ranges = {
-            'restricted_zones': {
-                'lower': np.array([100, 150, 200]),  # Light blue
-                'upper': np.array([150, 200, 255])
-            },
-            'entrances': {
-                'lower': np.array([200, 100, 100]),  # Light red
-                'upper': np.array([255, 150, 150])
-            }
+            'restricted_zones': [  # Light blue
+                (np.array([95, 60, 190]), np.array([120, 170, 255]))
+            ],
+            'entrances': [  # Light red
+                (np.array([0, 50, 190]), np.array([10, 170, 255])),
+                (np.array([170, 50, 190]), np.array([179, 170, 255]))
+            ]
         }
         
-        for category, color_range in color_ranges.items():
-            mask = cv2.inRange(img_array, color_range['lower'], color_range['upper'])
+        # Convert once and label every category in a single map
+        hsv = cv2.cvtColor(img_array, cv2.COLOR_RGB2HSV)
+        labels = np.zeros(hsv.shape[:2], dtype=np.uint8)
+        for label, bands in enumerate(color_ranges.values(), start=1):
+            for lower, upper in bands:
+                labels[cv2.inRange(hsv, lower, upper) > 0] = label
+        
+        # Split all colored pixels into regions in one pass
+        categories = list(color_ranges)
+        num, regions, stats, _ = cv2.connectedComponentsWithStats((labels > 0).astype(np.uint8),
+                                                                  connectivity=8)
+        
+        for i in range(1, num):
+            x, y, w, h, pixel_count = stats[i]
+            if pixel_count <= min_area:  # Too small to pass the contour area filter
+                continue
+            
+            # Work within the region's bounding box and take its dominant category
+            region = regions[y:y + h, x:x + w] == i
+            category = categories[np.bincount(labels[y:y + h, x:x + w][region]).argmax() - 1]
             
             # Find contours
-            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            contours, _ = cv2.findContours(region.astype(np.uint8), cv2.RETR_EXTERNAL,
+                                           cv2.CHAIN_APPROX_SIMPLE, offset=(int(x), int(y)))
             
             for contour in contours:
-                if cv2.contourArea(contour) > 100:  # Filter small noise
+                if cv2.contourArea(contour) > min_area:  # Filter small noise
                     # Approximate contour to polygon
                     epsilon = 0.02 * cv2.arcLength(contour, True)
                     approx = cv2.approxPolyDP(contour, epsilon, True)
@@ -158,20 +302,43 @@ class PDFParser:
         
         return entities
     
-    def _detect_lines(self, gray):
+    def _detect_lines(self, edges, scale=1.0):
         """Detect lines using Hough transform"""
+        import cv2
+        
         entities = []
         
-        # Edge detection
-        edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+        # Same acceptance as the Hough pass: enough edge pixels (votes), a minimum
+        # length and a maximum gap, all in page-raster pixels
+        min_votes, min_length, max_gap = 100 / scale, 50 / scale, 10 / scale
+        
+        # Axis-aligned fast path: floorplan walls are overwhelmingly horizontal or vertical
+        remaining = edges.copy()
+        for y, x0, x1 in self._axis_aligned_runs(remaining, min_length, max_gap, min_votes):
+            entities.append({
+                'type': 'LINE',
+                'start': (x0, y),
+                'end': (x1, y),
+                'layer': 'PDF_DETECTED_LINES'
+            })
+            remaining[y, x0:x1 + 1] = 0
+        
+        for x, y0, y1 in self._axis_aligned_runs(remaining.T, min_length, max_gap, min_votes):
+            entities.append({
+                'type': 'LINE',
+                'start': (x, y0),
+                'end': (x, y1),
+                'layer': 'PDF_DETECTED_LINES'
+            })
+            remaining[y0:y1 + 1, x] = 0
         
-        # Hough line detection
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=100, 
-                               minLineLength=50, maxLineGap=10)
+        # Hough line detection for whatever is left (diagonals), on a coarser accumulator;
+        # votes count edge pixels, so the vote threshold shrinks with line lengths
+        lines = cv2.HoughLinesP(remaining, rho=2, theta=np.pi / 90, threshold=max(1, round(min_votes)),
+                                minLineLength=min_length, maxLineGap=max_gap)
         
         if lines is not None:
-            for line in lines:
-                x1, y1, x2, y2 = line[0]
+            for x1, y1, x2, y2 in lines.reshape(-1, 4):
                 entities.append({
                     'type': 'LINE',
                     'start': (x1, y1),
@@ -181,23 +348,64 @@ class PDFParser:
         
         return entities
     
-    def _detect_circles(self, gray):
+    def _axis_aligned_runs(self, edges, min_length=50, max_gap=10, min_count=100, min_fill=0.9):
+        """Find straight edge runs along each row as (row, start, end) triples"""
+        runs = []
+        
+        # Only rows holding enough edge pixels can contain a run worth keeping
+        candidate_rows = np.flatnonzero(np.count_nonzero(edges, axis=1) >= min_count)
+        
+        for row in candidate_rows:
+            cols = np.flatnonzero(edges[row])
+            breaks = np.flatnonzero(np.diff(cols) > max_gap + 1)
+            first = np.concatenate(([0], breaks + 1))
+            last = np.concatenate((breaks, [len(cols) - 1]))
+            
+            # Text also leaves long gappy rows of edge pixels; a line's edge
+            # fills nearly all of its run, and must gather enough votes itself
+            lengths = cols[last] - cols[first] + 1
+            counts = last - first + 1
+            keep = (lengths >= min_length) & (counts >= min_count) & (counts >= min_fill * lengths)
+            
+            for start, end in zip(cols[first[keep]], cols[last[keep]]):
+                runs.append((int(row), int(start), int(end)))
+        
+        return runs
+    
+    def _detect_circles(self, edges, scale=1.0):
         """Detect circular elements (doors, windows)"""
+        import cv2
+        
         entities = []
+        min_points = 20 / scale
+        min_radius, max_radius = 10 / scale, 100 / scale
+        duplicate_dist_sq = (20 / scale) ** 2
         
-        # Hough circle detection
-        circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1, 20,
-                                  param1=50, param2=30, minRadius=10, maxRadius=100)
+        # Circles are closed edge contours that nearly fill their enclosing circle
+        contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_NONE)
         
-        if circles is not None:
-            circles = np.round(circles[0, :]).astype("int")
-            for (x, y, r) in circles:
-                entities.append({
-                    'type': 'CIRCLE',
-                    'center': (x, y),
-                    'radius': r,
-                    'layer': 'PDF_CIRCLES'
-                })
+        centers = []
+        for contour in contours:
+            if len(contour) <= min_points:
+                continue
+            
+            (x, y), r = cv2.minEnclosingCircle(contour)
+            if not min_radius <= r <= max_radius:
+                continue
+            if abs(cv2.contourArea(contour) / (np.pi * r * r) - 1) >= 0.2:
+                continue
+            
+            # Inner and outer edges of a stroke give concentric duplicates
+            if any((x - cx) ** 2 + (y - cy) ** 2 < duplicate_dist_sq for cx, cy in centers):
+                continue
+            centers.append((x, y))
+            
+            entities.append({
+                'type': 'CIRCLE',
+                'center': (int(round(x)), int(round(y))),
+                'radius': int(round(r)),
+                'layer': 'PDF_CIRCLES'
+            })
         
         return entities
     
@@ -234,7 +442,26 @@ class PDFParser:
         
         return classified
 
-def parse_pdf(file_path):
+# Parser shared by all pages a worker process handles, so its scratch buffers
+# carry over; only worker processes ever set it
+_page_parser = None
+
+def _process_page(file_path, page_num, dpi, detection_dpi, scale_factor, file_hash, force_refresh=False):
+    """Process one page in a worker; pdfplumber objects are not picklable, so reopen the file"""
+    import pdfplumber
+    
+    global _page_parser
+    if _page_parser is None:
+        _page_parser = PDFParser()
+    parser = _page_parser
+    parser.dpi = dpi
+    parser.detection_dpi = detection_dpi
+    parser.scale_factor = scale_factor
+    with pdfplumber.open(file_path) as pdf:
+        return parser._process_page(pdf.pages[page_num], page_num, len(pdf.pages),
+                                    file_hash, force_refresh)
+
+def parse_pdf(file_path, force_refresh=False):
     """Main parsing function for backward compatibility"""
     parser = PDFParser()
-    return parser.parse_pdf(file_path)
\ No newline at end of file
+    return parser.parse_pdf(file_path, force_refresh)
\ No newline at end of file
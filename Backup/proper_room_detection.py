@@ -4,10 +4,11 @@ import ezdxf
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button
 import matplotlib.patches as patches
-from shapely.geometry import Polygon, Point, LineString, MultiPolygon
-from shapely.ops import unary_union, polygonize
+from shapely.geometry import Polygon, LineString
+from shapely.strtree import STRtree
 import numpy as np
-from scipy.spatial import distance_matrix
+import shapely
+import cv2
 
 class ProperRoomDetection:
     def __init__(self):
@@ -16,6 +17,18 @@ class ProperRoomDetection:
         self.boundaries = []
         self.text_labels = []
         
+        # Room types matched by layer name keywords, checked in order
+        self._layer_keywords = [
+            ('bathroom', ('wc', 'toilet', 'bath', 'sdb')),
+            ('kitchen', ('kitchen', 'cuisine', 'cook')),
+            ('bedroom', ('bedroom', 'chambre', 'bed')),
+            ('living', ('living', 'salon', 'séjour')),
+            ('office', ('office', 'bureau', 'work')),
+            ('storage', ('storage', 'closet', 'placard')),
+            ('corridor', ('corridor', 'hall', 'passage')),
+            ('balcony', ('balcon', 'terrace', 'terrasse'))
+        ]
+        
     def analyze_ovo_properly(self, dxf_path):
         """Properly analyze the OVO file with correct room detection"""
         print("🔍 PROPER ROOM DETECTION - Analyzing OVO file...")
@@ -23,60 +36,58 @@ class ProperRoomDetection:
         doc = ezdxf.readfile(dxf_path)
         msp = doc.modelspace()
         
-        # Collect all entities by layer
-        layers = {}
-        for entity in msp:
-            layer = entity.dxf.layer
-            if layer not in layers:
-                layers[layer] = []
-            layers[layer].append(entity)
+        # Query each entity type once instead of dispatching on dxftype() per entity
+        polylines = msp.query('LWPOLYLINE')
+        hatches = msp.query('HATCH')
+        texts = msp.query('TEXT MTEXT')
         
-        print(f"📋 Found layers: {list(layers.keys())}")
+        layers = dict.fromkeys(entity.dxf.layer for entity in (*polylines, *hatches, *texts))
+        print(f"📋 Found layers: {list(layers)}")
         
         # Extract walls and boundaries
         wall_lines = []
         room_polygons = []
         
-        for layer_name, entities in layers.items():
-            print(f"🔍 Processing layer '{layer_name}': {len(entities)} entities")
-            
-            for entity in entities:
-                if entity.dxftype() == 'LWPOLYLINE':
-                    points = [(p[0], p[1]) for p in entity.get_points()]
-                    if len(points) >= 2:
-                        # Check if it's a closed polygon (room boundary)
-                        if len(points) >= 3 and self._is_closed_polygon(points):
-                            poly = Polygon(points)
-                            if poly.is_valid and poly.area > 1:  # Minimum 1m² room
-                                room_polygons.append({
-                                    'geometry': poly,
-                                    'layer': layer_name,
-                                    'area': poly.area,
-                                    'type': self._classify_room_from_layer(layer_name, poly)
-                                })
-                                print(f"  ✓ Found room: {poly.area:.1f}m² on layer {layer_name}")
-                        else:
-                            # It's a wall line
-                            wall_lines.append(LineString(points))
-                
-                elif entity.dxftype() == 'HATCH':
-                    # Hatched areas are often rooms
-                    hatch_polys = self._extract_hatch_boundaries(entity)
-                    for poly in hatch_polys:
-                        if poly.area > 1:
-                            room_polygons.append({
-                                'geometry': poly,
-                                'layer': layer_name,
-                                'area': poly.area,
-                                'type': self._classify_room_from_layer(layer_name, poly)
-                            })
-                            print(f"  ✓ Found hatched room: {poly.area:.1f}m² on layer {layer_name}")
-                
-                elif entity.dxftype() in ['TEXT', 'MTEXT']:
-                    # Text labels help identify rooms
-                    text_info = self._extract_text_info(entity)
-                    if text_info:
-                        self.text_labels.append(text_info)
+        print(f"🔍 Processing {len(polylines)} polylines")
+        for entity in polylines:
+            layer_name = entity.dxf.layer
+            points = [(p[0], p[1]) for p in entity.get_points()]
+            if len(points) >= 2:
+                # Check if it's a closed polygon (room boundary)
+                if len(points) >= 3 and self._is_closed_polygon(points):
+                    poly = Polygon(points)
+                    if poly.is_valid and poly.area > 1:  # Minimum 1m² room
+                        room_polygons.append({
+                            'geometry': poly,
+                            'layer': layer_name,
+                            'area': poly.area,
+                            'type': self._classify_room_from_layer(layer_name, poly)
+                        })
+                        print(f"  ✓ Found room: {poly.area:.1f}m² on layer {layer_name}")
+                else:
+                    # It's a wall line
+                    wall_lines.append(LineString(points))
+        
+        print(f"🔍 Processing {len(hatches)} hatches")
+        for entity in hatches:
+            # Hatched areas are often rooms
+            layer_name = entity.dxf.layer
+            hatch_polys = self._extract_hatch_boundaries(entity)
+            for poly in hatch_polys:
+                if poly.area > 1:
+                    room_polygons.append({
+                        'geometry': poly,
+                        'layer': layer_name,
+                        'area': poly.area,
+                        'type': self._classify_room_from_layer(layer_name, poly)
+                    })
+                    print(f"  ✓ Found hatched room: {poly.area:.1f}m² on layer {layer_name}")
+        
+        for entity in texts:
+            # Text labels help identify rooms
+            text_info = self._extract_text_info(entity)
+            if text_info:
+                self.text_labels.append(text_info)
         
         # If no room polygons found, detect from wall network
         if not room_polygons:
@@ -105,11 +116,10 @@ class ProperRoomDetection:
             return False
         
         # Check if first and last points are close
-        first = points[0]
-        last = points[-1]
-        distance = ((first[0] - last[0])**2 + (first[1] - last[1])**2)**0.5
+        dx = points[0][0] - points[-1][0]
+        dy = points[0][1] - points[-1][1]
         
-        return distance < 0.1  # Within 10cm tolerance
+        return dx * dx + dy * dy < 0.01  # Within 10cm tolerance
 
     def _extract_hatch_boundaries(self, hatch_entity):
         """Extract polygon boundaries from hatch entity"""
@@ -176,22 +186,10 @@ class ProperRoomDetection:
         area = polygon.area
         
         # Layer-based classification
-        if any(keyword in layer_lower for keyword in ['wc', 'toilet', 'bath', 'sdb']):
-            return 'bathroom'
-        elif any(keyword in layer_lower for keyword in ['kitchen', 'cuisine', 'cook']):
-            return 'kitchen'
-        elif any(keyword in layer_lower for keyword in ['bedroom', 'chambre', 'bed']):
-            return 'bedroom'
-        elif any(keyword in layer_lower for keyword in ['living', 'salon', 'séjour']):
-            return 'living'
-        elif any(keyword in layer_lower for keyword in ['office', 'bureau', 'work']):
-            return 'office'
-        elif any(keyword in layer_lower for keyword in ['storage', 'closet', 'placard']):
-            return 'storage'
-        elif any(keyword in layer_lower for keyword in ['corridor', 'hall', 'passage']):
-            return 'corridor'
-        elif any(keyword in layer_lower for keyword in ['balcon', 'terrace', 'terrasse']):
-            return 'balcony'
+        if layer_lower:
+            for room_type, keywords in self._layer_keywords:
+                if any(keyword in layer_lower for keyword in keywords):
+                    return room_type
         
         # Area-based classification if no layer match
         if area < 3:
@@ -215,128 +213,87 @@ class ProperRoomDetection:
         print("🔍 Detecting rooms from wall network...")
         
         # Get overall bounds
-        all_coords = []
-        for wall in wall_lines:
-            all_coords.extend(list(wall.coords))
+        coords_array, wall_index = shapely.get_coordinates(np.asarray(wall_lines, dtype=object),
+                                                           return_index=True)
         
-        if not all_coords:
+        if not len(coords_array):
             return []
         
-        coords_array = np.array(all_coords)
         bounds = (coords_array[:, 0].min(), coords_array[:, 1].min(),
                  coords_array[:, 0].max(), coords_array[:, 1].max())
         
         print(f"Building bounds: {bounds}")
         
-        # Create a finer grid for room detection
-        rooms = []
-        grid_density = 20  # More points for better detection
+        # Rasterize the walls once and measure every pixel's clearance with a distance transform
+        resolution = max(0.05, (bounds[2] - bounds[0]) / 4000, (bounds[3] - bounds[1]) / 4000)
+        width = int(np.ceil((bounds[2] - bounds[0]) / resolution)) + 1
+        height = int(np.ceil((bounds[3] - bounds[1]) / resolution)) + 1
         
-        x_range = np.linspace(bounds[0], bounds[2], grid_density)
-        y_range = np.linspace(bounds[1], bounds[3], grid_density)
+        free = np.ones((height, width), dtype=np.uint8)
+        origin = np.array([bounds[0], bounds[1]])
+        pixels = np.round((coords_array - origin) / resolution).astype(np.int32)
+        splits = np.flatnonzero(np.diff(wall_index)) + 1
+        cv2.polylines(free, np.split(pixels, splits), False, 0, thickness=1)
         
-        processed_points = set()
+        clearance = cv2.distanceTransform(free, cv2.DIST_L2, 5) * resolution
         
-        for i, x in enumerate(x_range):
-            for j, y in enumerate(y_range):
-                if (i, j) in processed_points:
-                    continue
-                
-                test_point = Point(x, y)
-                
-                # Check if point is inside a room (away from walls)
-                min_wall_distance = min([wall.distance(test_point) for wall in wall_lines])
-                
-                if min_wall_distance > 1.0:  # Point is inside a room
-                    # Grow region around this point to find room boundary
-                    room_points = self._grow_room_region(x, y, wall_lines, x_range, y_range)
-                    
-                    if len(room_points) > 4:  # Minimum points for a room
-                        try:
-                            # Create convex hull of room points
-                            from scipy.spatial import ConvexHull
-                            hull = ConvexHull(room_points)
-                            room_coords = [room_points[i] for i in hull.vertices]
-                            
-                            room_poly = Polygon(room_coords)
-                            if room_poly.is_valid and room_poly.area > 4:  # Minimum 4m²
-                                rooms.append({
-                                    'geometry': room_poly,
-                                    'layer': 'detected',
-                                    'area': room_poly.area,
-                                    'type': self._classify_room_from_layer('', room_poly)
-                                })
-                                
-                                # Mark processed grid points
-                                for px, py in room_points:
-                                    pi = np.argmin(np.abs(x_range - px))
-                                    pj = np.argmin(np.abs(y_range - py))
-                                    processed_points.add((pi, pj))
-                                
-                                print(f"  ✓ Detected room: {room_poly.area:.1f}m²")
-                        except:
-                            pass
+        # Points more than 1m from any wall are inside a room
+        inside = (clearance > 1.0).astype(np.uint8)
+        num, labels, stats, _ = cv2.connectedComponentsWithStats(inside, connectivity=8)
         
-        return rooms
-
-    def _grow_room_region(self, start_x, start_y, wall_lines, x_range, y_range):
-        """Grow region from seed point to find room boundary"""
-        room_points = [(start_x, start_y)]
-        to_check = [(start_x, start_y)]
-        checked = set()
-        
-        step_size = (x_range[1] - x_range[0]) if len(x_range) > 1 else 1.0
-        
-        while to_check and len(room_points) < 100:  # Limit to prevent infinite loops
-            current_x, current_y = to_check.pop(0)
+        rooms = []
+        for i in range(1, num):
+            x, y, w, h, pixel_count = stats[i]
             
-            if (current_x, current_y) in checked:
+            # Regions touching the raster edge are outside the building
+            if x == 0 or y == 0 or x + w == width or y + h == height:
                 continue
-            checked.add((current_x, current_y))
             
-            # Check 8 neighboring points
-            for dx in [-step_size, 0, step_size]:
-                for dy in [-step_size, 0, step_size]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    
-                    new_x = current_x + dx
-                    new_y = current_y + dy
-                    
-                    # Check bounds
-                    if (new_x < x_range[0] or new_x > x_range[-1] or
-                        new_y < y_range[0] or new_y > y_range[-1]):
-                        continue
-                    
-                    if (new_x, new_y) in checked:
-                        continue
-                    
-                    test_point = Point(new_x, new_y)
-                    min_wall_distance = min([wall.distance(test_point) for wall in wall_lines])
-                    
-                    if min_wall_distance > 1.0:  # Still inside room
-                        room_points.append((new_x, new_y))
-                        to_check.append((new_x, new_y))
-        
-        return room_points
+            component = (labels[y:y + h, x:x + w] == i).astype(np.uint8)
+            contours, _ = cv2.findContours(component, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            if not contours or len(contours[0]) < 3:
+                continue
+            
+            try:
+                room_coords = (contours[0].reshape(-1, 2) + (x, y)) * resolution + origin
+                
+                # Grow the core region back out to the walls
+                room_poly = Polygon(room_coords).buffer(1.0, join_style=2)
+                if room_poly.is_valid and room_poly.area > 4:  # Minimum 4m²
+                    rooms.append({
+                        'geometry': room_poly,
+                        'layer': 'detected',
+                        'area': room_poly.area,
+                        'type': self._classify_room_from_layer('', room_poly)
+                    })
+                    print(f"  ✓ Detected room: {room_poly.area:.1f}m²")
+            except:
+                pass
+        
+        return rooms
 
     def _assign_text_to_rooms(self, room_polygons):
         """Assign text labels to nearby rooms"""
-        for text_info in self.text_labels:
-            text_point = Point(text_info['position'])
-            
-            # Find closest room
-            min_distance = float('inf')
-            closest_room = None
-            
-            for room in room_polygons:
-                distance = room['geometry'].distance(text_point)
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_room = room
+        if not room_polygons or not self.text_labels:
+            return
+        
+        # Spatial index over room geometries, queried for all labels in one call
+        tree = STRtree([room['geometry'] for room in room_polygons])
+        text_points = shapely.points(np.array([t['position'] for t in self.text_labels], dtype=np.float64))
+        (text_idx, room_idx), distances = tree.query_nearest(
+            text_points, max_distance=5.0, return_distance=True, all_matches=True)
+        
+        # Equidistant rooms all match; keep the first room, as a linear scan
+        # would, and apply labels in their original order so later labels still win
+        order = np.lexsort((room_idx, text_idx))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = text_idx[order[1:]] != text_idx[order[:-1]]
+        for k in order[first]:
+            text_info = self.text_labels[text_idx[k]]
+            closest_room = room_polygons[room_idx[k]]
             
             # If text is close to room (within 5m), use text for room type
-            if closest_room and min_distance < 5.0:
+            if distances[k] < 5.0:
                 text = text_info['text'].lower()
                 if any(keyword in text for keyword in ['wc', 'toilet', 'bath']):
                     closest_room['type'] = 'bathroom'
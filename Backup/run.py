@@ -6,6 +6,7 @@ Professional CAD Analysis & Îlot Placement Engine
 
 import os
 import sys
+import importlib.util
 from pathlib import Path
 
 # Add project root to Python path
@@ -20,13 +21,9 @@ def check_dependencies():
         'PIL', 'scipy', 'networkx', 'skimage'
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    # Locate packages without importing them; the app imports what it needs itself
+    missing_packages = [package for package in required_packages
+                        if importlib.util.find_spec(package.replace('-', '_')) is None]
     
     if missing_packages:
         print("❌ Missing required packages:")
@@ -73,11 +70,12 @@ def main():
     
     print(f"✓ Python {sys.version.split()[0]}")
     
-    # Check dependencies
-    if not check_dependencies():
-        sys.exit(1)
-    
-    print("✓ All dependencies installed")
+    # Check dependencies (set FPG_SKIP_DEPCHECK=1 to skip on known-good images)
+    if os.environ.get('FPG_SKIP_DEPCHECK') != '1':
+        if not check_dependencies():
+            sys.exit(1)
+        
+        print("✓ All dependencies installed")
     
     # Setup directories
     setup_directories()
@@ -5,14 +5,68 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import Button, Slider
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch, Circle, Wedge, Arc
+from matplotlib.collections import LineCollection, PatchCollection
 from shapely.geometry import Polygon, Point, LineString, MultiPolygon
 from shapely.ops import unary_union, polygonize
+from shapely.strtree import STRtree
 import numpy as np
+import shapely
 import networkx as nx
 from scipy.spatial import Voronoi, voronoi_plot_2d
 from scipy.spatial.distance import cdist
 import json
 import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class _FloorSnapshot:
+    """Per-floor lookups shared by the panels and click handling, built once per floor"""
+    rooms: list
+    room_geoms: np.ndarray
+    room_areas: np.ndarray
+    tree: STRtree
+    doors: list
+    windows: list
+
+class _LazyPaths:
+    """Accessible shortest path between two rooms, computed on first query"""
+    
+    def __init__(self, graph):
+        self._graph = graph
+        self._cache = {}
+        self._component = None
+        
+        # Edges through doors narrower than 80cm, in both directions
+        self._inaccessible = set()
+        for u, v, data in graph.edges(data=True):
+            if not data.get('accessible', False):
+                self._inaccessible.add((u, v))
+                self._inaccessible.add((v, u))
+
+    def __call__(self, source, target):
+        """Shortest path from source to target if every door on it is accessible, else None"""
+        if source == target or source not in self._graph or target not in self._graph:
+            return None
+        
+        # Rooms in different connected components have no path at all
+        if self._component is None:
+            self._component = {node: i for i, nodes in enumerate(nx.connected_components(self._graph))
+                               for node in nodes}
+        if self._component[source] != self._component[target]:
+            return None
+        
+        # One Dijkstra per source yields the shortest path to every reachable node
+        if source not in self._cache:
+            self._cache[source] = nx.single_source_dijkstra_path(self._graph, source, weight='weight')
+        path = self._cache[source].get(target)
+        
+        # Check if entire path is accessible
+        if path is None or any(edge in self._inaccessible for edge in zip(path, path[1:])):
+            return None
+        return path
 
 class SophisticatedArchitecturalEngine:
     def __init__(self):
@@ -30,6 +84,7 @@ class SophisticatedArchitecturalEngine:
         self.view_center = (0, 0)
         self.active_room = None
         self.navigation_graph = nx.Graph()
+        self._snapshots = {}
         
         # Professional architectural color scheme
         self.arch_colors = {
@@ -81,6 +136,32 @@ class SophisticatedArchitecturalEngine:
             'stair': ['stair', 'escalier', 'step'],
             'balcony': ['balcon', 'terrace', 'terrasse', 'deck']
         }
+        
+        # All room patterns in one regex: each alternative is a lookahead for one room
+        # type, tried in dict order, so the first matching type wins in a single search
+        self._room_re = re.compile('^(?:' + '|'.join(
+            f'(?=.*?(?:{"|".join(re.escape(p) for p in patterns)}))(?P<{room_type}>)'
+            for room_type, patterns in self.room_patterns.items()) + ')', re.S)
+        
+        # Layer name keywords per entity category, resolved once per distinct layer
+        self._layer_keywords = {
+            'wall': ['WALL', 'MUR', 'P'],
+            'door': ['DOOR', 'PORTE'],
+            'window': ['WINDOW', 'FENETRE'],
+            'room': ['ROOM', 'SPACE', 'LOCAL']
+        }
+        self._layer_kind = {}
+        
+        # DXF entity query -> parse handler; types sharing a handler share a query
+        # so their entities keep drawing order
+        self._entity_dispatch = {
+            'LWPOLYLINE': self._parse_lwpolyline,
+            'POLYLINE': self._parse_room_boundary,
+            'ARC CIRCLE': self._parse_door,
+            'LINE': self._parse_window,
+            'TEXT MTEXT': self._parse_text,
+            'HATCH': self._parse_hatch
+        }
 
     def parse_sophisticated_dxf(self, dxf_path):
         """Advanced DXF parsing with architectural intelligence"""
@@ -96,62 +177,41 @@ class SophisticatedArchitecturalEngine:
         structure = {'columns': [], 'beams': [], 'slabs': []}
         annotations = {'text': [], 'dimensions': [], 'symbols': []}
         
-        # Parse entities with layer intelligence
-        for entity in msp:
-            layer_name = entity.dxf.layer.upper()
-            entity_type = entity.dxftype()
-            
-            # Wall detection with thickness analysis
-            if entity_type == 'LWPOLYLINE' and any(wall_key in layer_name for wall_key in ['WALL', 'MUR', 'P']):
-                points = [(p[0], p[1]) for p in entity.get_points()]
-                wall_thickness = self._analyze_wall_thickness(entity)
-                
-                if wall_thickness > 200:  # Exterior walls (>20cm)
-                    walls['exterior'].append({'geometry': LineString(points), 'thickness': wall_thickness})
-                elif wall_thickness > 100:  # Load bearing (>10cm)
-                    walls['load_bearing'].append({'geometry': LineString(points), 'thickness': wall_thickness})
-                else:  # Partition walls
-                    walls['interior'].append({'geometry': LineString(points), 'thickness': wall_thickness})
-            
-            # Door detection with swing analysis
-            elif entity_type in ['ARC', 'CIRCLE'] and any(door_key in layer_name for door_key in ['DOOR', 'PORTE']):
-                door_data = self._analyze_door_swing(entity)
-                if door_data:
-                    openings['doors'].append(door_data)
-            
-            # Window detection
-            elif entity_type == 'LINE' and any(win_key in layer_name for win_key in ['WINDOW', 'FENETRE']):
-                window_data = self._analyze_window(entity)
-                if window_data:
-                    openings['windows'].append(window_data)
-            
-            # Room boundary detection
-            elif entity_type in ['LWPOLYLINE', 'POLYLINE'] and any(room_key in layer_name for room_key in ['ROOM', 'SPACE', 'LOCAL']):
-                points = [(p[0], p[1]) for p in entity.get_points()]
-                if len(points) >= 3:
-                    room_poly = Polygon(points)
-                    room_type = self._classify_room_type(layer_name, room_poly)
-                    spaces['rooms'].append({'geometry': room_poly, 'type': room_type, 'layer': layer_name})
-            
-            # Text and annotations
-            elif entity_type in ['TEXT', 'MTEXT']:
-                text_data = self._extract_text_annotation(entity)
-                annotations['text'].append(text_data)
-            
-            # Hatched areas (often restricted zones)
-            elif entity_type == 'HATCH':
-                hatch_data = self._analyze_hatch_pattern(entity)
-                if hatch_data:
-                    spaces['service'].append(hatch_data)
+        # Flat per-segment wall arrays, filled alongside the wall dicts
+        seg_xy = []
+        seg_meta = []
+        parsed = {'walls': walls, 'openings': openings, 'spaces': spaces,
+                  'annotations': annotations, 'seg_xy': seg_xy, 'seg_meta': seg_meta}
+        
+        # Parse entities with layer intelligence, one modelspace query per handler
+        for query, handler in self._entity_dispatch.items():
+            for entity in msp.query(query):
+                layer_name = entity.dxf.layer.upper()
+                handler(entity, layer_name, self._classify_layer(layer_name), parsed)
+        
+        # Contiguous (N, 4) segment endpoints plus per-segment thickness and kind
+        self._walls_xy = np.concatenate(seg_xy) if seg_xy else np.empty((0, 4))
+        self._walls_meta = np.array(seg_meta, dtype=[('thickness', 'f4'), ('kind', 'U12')])
         
         # Advanced room detection from wall network
         if not spaces['rooms']:
             spaces['rooms'] = self._detect_rooms_from_walls(walls)
         
+        # Exterior ring coordinates, read from GEOS once for rendering and highlighting
+        for room in spaces['rooms']:
+            geom = room['geometry']
+            room['_exterior_xy'] = np.asarray(geom.exterior.coords) if hasattr(geom, 'exterior') else None
+        
+        # Room centroids and areas as one structured array for batched math
+        self._rooms_soa = np.array([(room['cx'], room['cy'], room['area']) for room in spaces['rooms']],
+                                   dtype=[('cx', 'f8'), ('cy', 'f8'), ('area', 'f8')])
+        spaces['areas'] = self._rooms_soa['area']
+        
         # Build circulation network
         circulation_network = self._build_circulation_network(walls, openings, spaces)
         
-        # Store parsed data
+        # Store parsed data, dropping any snapshot of the floor it replaces
+        self._snapshots.pop(self.current_floor, None)
         self.building_data['floors'][self.current_floor] = {
             'walls': walls,
             'openings': openings,
@@ -164,6 +224,73 @@ class SophisticatedArchitecturalEngine:
         print(f"✅ Parsed: {len(walls['exterior'])+len(walls['interior'])} walls, {len(openings['doors'])} doors, {len(spaces['rooms'])} rooms")
         return self.building_data
 
+    def _classify_layer(self, layer_name):
+        """Categories a layer belongs to, computed once per distinct layer name"""
+        kind = self._layer_kind.get(layer_name)
+        if kind is None:
+            kind = frozenset(category for category, keys in self._layer_keywords.items()
+                             if any(key in layer_name for key in keys))
+            self._layer_kind[layer_name] = kind
+        return kind
+
+    def _parse_lwpolyline(self, entity, layer_name, kind, parsed):
+        """Wall detection with thickness analysis, falling back to room boundaries"""
+        if 'wall' not in kind:
+            self._parse_room_boundary(entity, layer_name, kind, parsed)
+            return
+        
+        points = np.asarray(entity.get_points('xy'), dtype=np.float64).reshape(-1, 2)
+        wall_thickness = self._analyze_wall_thickness(entity)
+        
+        if wall_thickness > 200:  # Exterior walls (>20cm)
+            wall_kind = 'exterior'
+        elif wall_thickness > 100:  # Load bearing (>10cm)
+            wall_kind = 'load_bearing'
+        else:  # Partition walls
+            wall_kind = 'interior'
+        parsed['walls'][wall_kind].append({'geometry': LineString(points), 'thickness': wall_thickness,
+                                           '_xy': points})
+        
+        parsed['seg_xy'].append(np.hstack([points[:-1], points[1:]]))
+        parsed['seg_meta'].extend([(wall_thickness, wall_kind)] * (len(points) - 1))
+
+    def _parse_room_boundary(self, entity, layer_name, kind, parsed):
+        """Room boundary detection"""
+        if 'room' not in kind:
+            return
+        
+        points = np.asarray(entity.get_points('xy'), dtype=np.float64).reshape(-1, 2)
+        if len(points) >= 3:
+            room_poly = Polygon(points)
+            room_type = self._classify_room_type(layer_name, room_poly)
+            centroid = room_poly.centroid
+            parsed['spaces']['rooms'].append({'geometry': room_poly, 'type': room_type, 'layer': layer_name,
+                                              'cx': centroid.x, 'cy': centroid.y, 'area': room_poly.area})
+
+    def _parse_door(self, entity, layer_name, kind, parsed):
+        """Door detection with swing analysis"""
+        if 'door' in kind:
+            door_data = self._analyze_door_swing(entity)
+            if door_data:
+                parsed['openings']['doors'].append(door_data)
+
+    def _parse_window(self, entity, layer_name, kind, parsed):
+        """Window detection"""
+        if 'window' in kind:
+            window_data = self._analyze_window(entity)
+            if window_data:
+                parsed['openings']['windows'].append(window_data)
+
+    def _parse_text(self, entity, layer_name, kind, parsed):
+        """Text and annotations"""
+        parsed['annotations']['text'].append(self._extract_text_annotation(entity))
+
+    def _parse_hatch(self, entity, layer_name, kind, parsed):
+        """Hatched areas (often restricted zones)"""
+        hatch_data = self._analyze_hatch_pattern(entity)
+        if hatch_data:
+            parsed['spaces']['service'].append(hatch_data)
+
     def _analyze_wall_thickness(self, entity):
         """Analyze wall thickness from polyline width or parallel lines"""
         if hasattr(entity, 'dxf') and hasattr(entity.dxf, 'const_width'):
@@ -197,6 +324,7 @@ class SophisticatedArchitecturalEngine:
         
         return {
             'line': LineString([start, end]),
+            '_xy': np.array([start, end]),
             'length': length,
             'center': ((start[0] + end[0])/2, (start[1] + end[1])/2),
             'orientation': math.atan2(end[1] - start[1], end[0] - start[0])
@@ -208,9 +336,9 @@ class SophisticatedArchitecturalEngine:
         area = room_polygon.area
         
         # Check layer name patterns
-        for room_type, patterns in self.room_patterns.items():
-            if any(pattern in layer_lower for pattern in patterns):
-                return room_type
+        match = self._room_re.search(layer_lower)
+        if match:
+            return match.lastgroup
         
         # Classify by area if no pattern match
         if area < 4:
@@ -274,29 +402,14 @@ class SophisticatedArchitecturalEngine:
         """Advanced room detection using wall network analysis"""
         print("🔍 Detecting rooms from wall network...")
         
-        # Combine all walls
-        all_walls = []
-        for wall_type in walls.values():
-            for wall in wall_type:
-                all_walls.append(wall['geometry'])
-        
-        if not all_walls:
-            return []
-        
-        # Create wall network
-        wall_union = unary_union(all_walls)
-        
-        # Use Voronoi diagram for space partitioning
-        wall_coords = []
-        for wall in all_walls:
-            coords = list(wall.coords)
-            wall_coords.extend(coords)
+        # Use the flat segment array for bounds and distances
+        segments = self._walls_xy
+        coords_array = segments.reshape(-1, 2)
         
-        if len(wall_coords) < 4:
+        if len(coords_array) < 4:
             return []
         
         # Create bounding box
-        coords_array = np.array(wall_coords)
         bounds = (coords_array[:, 0].min(), coords_array[:, 1].min(), 
                  coords_array[:, 0].max(), coords_array[:, 1].max())
         
@@ -306,61 +419,153 @@ class SophisticatedArchitecturalEngine:
         x_range = np.arange(bounds[0], bounds[2], grid_size)
         y_range = np.arange(bounds[1], bounds[3], grid_size)
         
+        # Accepted rooms bucketed by the grid cells their bounds overlap, so each
+        # candidate is only compared with rooms nearby
         processed_areas = []
-        
-        for x in x_range:
-            for y in y_range:
-                test_point = Point(x, y)
-                
-                # Check if point is in a valid room space
-                min_distance = min([wall.distance(test_point) for wall in all_walls])
+        room_grid = {}
+        room_cell = 20.0
+        
+        # Squared distance from every grid point to the nearest wall segment, only as far
+        # as the flood fill can grow (walls further away cannot change a room)
+        xs, ys = np.meshgrid(x_range, y_range, indexing='ij')
+        xs, ys = xs.ravel(), ys.ravel()
+        min_sq_distances = self._nearby_wall_sq_distances(xs, ys, segments, reach=10.0)
+        
+        # Only points away from walls (inside a room) can seed a room; the square root
+        # is only taken for those seeds
+        for k in np.flatnonzero(min_sq_distances > 1.5 ** 2):
+            test_point = Point(xs[k], ys[k])
+            
+            # Flood fill to find room boundary
+            room_boundary = self._flood_fill_room(test_point, np.sqrt(min_sq_distances[k]))
+            
+            if room_boundary and room_boundary.area > 4:  # Minimum room size
+                # Check if this room overlaps with existing rooms
+                overlap = False
+                cells = self._bbox_cells(room_boundary.bounds, room_cell)
+                nearby = sorted({i for cell in cells for i in room_grid.get(cell, ())})
+                for i in nearby:
+                    existing_room = processed_areas[i]
+                    if room_boundary.intersects(existing_room) and room_boundary.intersection(existing_room).area > room_boundary.area * 0.5:
+                        overlap = True
+                        break
                 
-                if min_distance > 1.5:  # Point is away from walls (inside room)
-                    # Flood fill to find room boundary
-                    room_boundary = self._flood_fill_room(test_point, all_walls, bounds)
-                    
-                    if room_boundary and room_boundary.area > 4:  # Minimum room size
-                        # Check if this room overlaps with existing rooms
-                        overlap = False
-                        for existing_room in processed_areas:
-                            if room_boundary.intersects(existing_room) and room_boundary.intersection(existing_room).area > room_boundary.area * 0.5:
-                                overlap = True
-                                break
-                        
-                        if not overlap:
-                            room_type = self._classify_room_by_geometry(room_boundary)
-                            rooms.append({
-                                'geometry': room_boundary,
-                                'type': room_type,
-                                'center': (room_boundary.centroid.x, room_boundary.centroid.y),
-                                'area': room_boundary.area
-                            })
-                            processed_areas.append(room_boundary)
+                if not overlap:
+                    room_type = self._classify_room_by_geometry(room_boundary)
+                    centroid = room_boundary.centroid
+                    rooms.append({
+                        'geometry': room_boundary,
+                        'type': room_type,
+                        'center': (centroid.x, centroid.y),
+                        'cx': centroid.x,
+                        'cy': centroid.y,
+                        'area': room_boundary.area
+                    })
+                    for cell in cells:
+                        room_grid.setdefault(cell, []).append(len(processed_areas))
+                    processed_areas.append(room_boundary)
         
         print(f"✅ Detected {len(rooms)} rooms from wall network")
         return rooms
 
-    def _flood_fill_room(self, start_point, walls, bounds, max_radius=10):
+    def _bbox_cells(self, bounds, cell):
+        """Keys of the uniform grid cells a bounding box overlaps"""
+        ix0, iy0 = math.floor(bounds[0] / cell), math.floor(bounds[1] / cell)
+        ix1, iy1 = math.floor(bounds[2] / cell), math.floor(bounds[3] / cell)
+        return [(ix, iy) for ix in range(ix0, ix1 + 1) for iy in range(iy0, iy1 + 1)]
+
+    def _build_wall_grid(self, segments, origin, cell):
+        """Bucket wall segments into every uniform grid cell their bounding box overlaps"""
+        wall_grid = {}
+        lo = np.floor((np.minimum(segments[:, :2], segments[:, 2:]) - origin) / cell).astype(int)
+        hi = np.floor((np.maximum(segments[:, :2], segments[:, 2:]) - origin) / cell).astype(int)
+        
+        for k, (ix0, iy0, ix1, iy1) in enumerate(np.hstack([lo, hi])):
+            for ix in range(ix0, ix1 + 1):
+                for iy in range(iy0, iy1 + 1):
+                    wall_grid.setdefault((ix, iy), []).append(k)
+        
+        return wall_grid
+
+    def _nearby_wall_sq_distances(self, xs, ys, segments, reach):
+        """Squared nearest wall distance per point, exact up to reach (inf where no wall is that close)"""
+        distances = np.full(len(xs), np.inf, dtype=np.float32)
+        if not len(xs) or not len(segments):
+            return distances
+        
+        # With cells as wide as the reach, any wall within reach sits in the 3x3 neighbourhood
+        origin = np.array([xs.min(), ys.min()])
+        wall_grid = self._build_wall_grid(segments, origin, reach)
+        cells = np.floor((np.column_stack([xs, ys]) - origin) / reach).astype(int)
+        
+        # The distance kernel is memory-bound, so it runs in float32 on coordinates taken
+        # relative to the grid origin (large absolute DXF coordinates would lose precision)
+        local_xs = (xs - origin[0]).astype(np.float32)
+        local_ys = (ys - origin[1]).astype(np.float32)
+        local_segments = (segments - np.tile(origin, 2)).astype(np.float32)
+        
+        # Points sharing a cell share one candidate set and one vectorized distance call
+        keys, inverse = np.unique(cells, axis=0, return_inverse=True)
+        order = np.argsort(inverse.ravel(), kind='stable')
+        members_by_cell = np.split(order, np.cumsum(np.bincount(inverse.ravel()))[:-1])
+        
+        tasks = []
+        for (ix, iy), members in zip(keys, members_by_cell):
+            candidates = set()
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    candidates.update(wall_grid.get((ix + dx, iy + dy), ()))
+            
+            if candidates:
+                tasks.append((members, sorted(candidates)))
+        
+        def scan_cell(task):
+            members, candidates = task
+            return members, self._min_segment_sq_distances(
+                local_xs[members], local_ys[members], local_segments[candidates])
+        
+        # numpy releases the GIL, so cells are scanned in parallel; each writes its own points
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for members, cell_distances in pool.map(scan_cell, tasks):
+                distances[members] = cell_distances
+        
+        return distances
+
+    def _min_segment_sq_distances(self, xs, ys, segments):
+        """Minimum squared point-to-segment distance using clamped projection, in the segments' precision"""
+        xs = np.asarray(xs, dtype=segments.dtype)
+        ys = np.asarray(ys, dtype=segments.dtype)
+        
+        x1, y1, x2, y2 = segments.T
+        dx = x2 - x1
+        dy = y2 - y1
+        length_sq = dx * dx + dy * dy
+        length_sq[length_sq == 0] = 1.0
+        
+        distances = np.empty(len(xs), dtype=segments.dtype)
+        
+        # Chunk the points so the (points x segments) block stays around 4M entries
+        chunk_size = max(1, (1 << 22) // max(len(segments), 1))
+        for start in range(0, len(xs), chunk_size):
+            px = xs[start:start + chunk_size, None] - x1
+            py = ys[start:start + chunk_size, None] - y1
+            
+            t = np.clip((px * dx + py * dy) / length_sq, 0.0, 1.0)
+            ex = px - t * dx
+            ey = py - t * dy
+            
+            distances[start:start + chunk_size] = (ex * ex + ey * ey).min(axis=1)
+        
+        return distances
+
+    def _flood_fill_room(self, start_point, wall_distance, max_radius=10):
         """Flood fill algorithm to detect room boundaries"""
         # Simplified room boundary detection
         # Create a circular approximation around the point
-        center_x, center_y = start_point.x, start_point.y
         
-        # Find the maximum radius before hitting a wall
-        radius = 0.5
-        while radius < max_radius:
-            test_circle = start_point.buffer(radius)
-            
-            # Check if circle intersects any wall
-            intersects_wall = False
-            for wall in walls:
-                if test_circle.intersects(wall):
-                    intersects_wall = True
-                    break
-            
-            if intersects_wall:
-                break
-            radius += 0.5
+        # The circle grows in 0.5m steps until it reaches the nearest wall
+        radius = min(max(math.ceil(min(wall_distance, max_radius) / 0.5) * 0.5, 0.5), max_radius)
         
         # Create room polygon as a buffer around the point
         if radius > 1.0:
@@ -396,37 +601,37 @@ class SophisticatedArchitecturalEngine:
         room_nodes = {}
         for i, room in enumerate(spaces['rooms']):
             room_id = f"room_{i}"
-            center = room['geometry'].centroid
             room_nodes[room_id] = {
-                'position': (center.x, center.y),
+                'position': (room['cx'], room['cy']),
                 'type': room['type'],
-                'area': room['geometry'].area
+                'area': room['area']
             }
             self.navigation_graph.add_node(room_id, **room_nodes[room_id])
         
+        # Spatial index over room geometries for door lookups
+        room_ids = list(room_nodes)
+        room_geoms = np.array([room['geometry'] for room in spaces['rooms']], dtype=object)
+        tree = STRtree(room_geoms)
+        centroids = np.column_stack([self._rooms_soa['cx'], self._rooms_soa['cy']])
+        
         # Connect rooms through doors
         for door in openings['doors']:
             door_point = Point(door['center'])
             
-            # Find rooms connected by this door
-            connected_rooms = []
-            for room_id, room_data in room_nodes.items():
-                room_geom = spaces['rooms'][int(room_id.split('_')[1])]['geometry']
-                if room_geom.distance(door_point) < 2.0:  # Door is near room
-                    connected_rooms.append(room_id)
+            # Find rooms connected by this door (door is within 2m of room)
+            candidates = np.sort(tree.query(door_point, predicate='dwithin', distance=2.0))
+            near = candidates[shapely.distance(room_geoms[candidates], door_point) < 2.0]
+            if len(near) < 2:
+                continue
             
-            # Add edges between connected rooms
-            for i in range(len(connected_rooms)):
-                for j in range(i + 1, len(connected_rooms)):
-                    room1, room2 = connected_rooms[i], connected_rooms[j]
-                    distance = math.sqrt(
-                        (room_nodes[room1]['position'][0] - room_nodes[room2]['position'][0])**2 +
-                        (room_nodes[room1]['position'][1] - room_nodes[room2]['position'][1])**2
-                    )
-                    self.navigation_graph.add_edge(room1, room2, 
-                                                 weight=distance, 
-                                                 door_width=door['width'],
-                                                 accessible=door['width'] > 0.8)
+            # Add edges between connected rooms, weighted by centroid distance; only the
+            # upper triangle that becomes edges gets a square root
+            sq_distances = cdist(centroids[near], centroids[near], 'sqeuclidean')
+            for i, j in zip(*np.triu_indices(len(near), k=1)):
+                self.navigation_graph.add_edge(room_ids[near[i]], room_ids[near[j]], 
+                                             weight=math.sqrt(sq_distances[i, j]), 
+                                             door_width=door['width'],
+                                             accessible=door['width'] > 0.8)
         
         return {
             'graph': self.navigation_graph,
@@ -435,30 +640,9 @@ class SophisticatedArchitecturalEngine:
         }
 
     def _calculate_accessibility_paths(self):
-        """Calculate accessibility-compliant paths"""
-        accessible_paths = {}
-        
-        # Find all accessible routes (door width > 80cm)
-        for node1 in self.navigation_graph.nodes():
-            for node2 in self.navigation_graph.nodes():
-                if node1 != node2:
-                    try:
-                        path = nx.shortest_path(self.navigation_graph, node1, node2, weight='weight')
-                        
-                        # Check if entire path is accessible
-                        accessible = True
-                        for i in range(len(path) - 1):
-                            edge_data = self.navigation_graph.get_edge_data(path[i], path[i+1])
-                            if not edge_data.get('accessible', False):
-                                accessible = False
-                                break
-                        
-                        if accessible:
-                            accessible_paths[f"{node1}_to_{node2}"] = path
-                    except nx.NetworkXNoPath:
-                        pass
-        
-        return accessible_paths
+        """Calculate accessibility-compliant paths, lazily per queried source room"""
+        # Snapshot the graph so later parses don't change the answers
+        return _LazyPaths(self.navigation_graph.copy())
 
     def create_sophisticated_interactive_plan(self, dxf_path, output_path):
         """Create sophisticated interactive architectural plan"""
@@ -480,15 +664,18 @@ class SophisticatedArchitecturalEngine:
         
         # Render sophisticated plan
         self._render_sophisticated_plan(ax_main, building_data)
-        self._create_navigation_panel(ax_nav, building_data)
-        self._create_info_panel(ax_info, building_data)
+        snap = self._get_snapshot(self.current_floor, building_data)
+        self._create_navigation_panel(ax_nav, snap)
+        self._create_info_panel(ax_info, snap)
         self._create_control_panel(ax_controls, fig)
         
         # Set up interactivity
         self._setup_sophisticated_interactivity(fig, ax_main, building_data)
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        # Fast zlib level for the large 300 dpi PNG; the decoded pixels are unchanged
+        save_kwargs = {'pil_kwargs': {'compress_level': 1}} if str(output_path).lower().endswith('.png') else {}
+        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white', **save_kwargs)
         plt.show()
         
         return output_path
@@ -531,16 +718,14 @@ class SophisticatedArchitecturalEngine:
 
     def _draw_architectural_grid(self, ax, floor_data):
         """Draw professional architectural grid system"""
-        # Get building bounds
-        all_geoms = []
-        for wall_type in floor_data['walls'].values():
-            for wall in wall_type:
-                all_geoms.append(wall['geometry'])
+        # Get building bounds straight from the wall coordinates
+        wall_xy = [wall['_xy'] for wall_type in floor_data['walls'].values() for wall in wall_type]
         
-        if not all_geoms:
+        if not wall_xy:
             return
         
-        bounds = unary_union(all_geoms).bounds
+        xy = np.concatenate(wall_xy)
+        bounds = (xy[:, 0].min(), xy[:, 1].min(), xy[:, 0].max(), xy[:, 1].max())
         
         # Major grid (5m)
         major_spacing = 5.0
@@ -551,107 +736,109 @@ class SophisticatedArchitecturalEngine:
                            math.ceil(bounds[3]/major_spacing)*major_spacing + major_spacing, 
                            major_spacing)
         
-        for x in x_major:
-            ax.axvline(x, color=self.arch_colors['grid_major'], linewidth=0.8, alpha=0.6, zorder=0)
-        for y in y_major:
-            ax.axhline(y, color=self.arch_colors['grid_major'], linewidth=0.8, alpha=0.6, zorder=0)
+        major_style = dict(colors=self.arch_colors['grid_major'], linewidths=0.8, alpha=0.6, zorder=0)
+        self._add_grid_lines(ax, x_major, y_major, major_style)
         
         # Minor grid (1m)
         minor_spacing = 1.0
         x_minor = np.arange(bounds[0], bounds[2], minor_spacing)
         y_minor = np.arange(bounds[1], bounds[3], minor_spacing)
         
-        for x in x_minor:
-            if x not in x_major:
-                ax.axvline(x, color=self.arch_colors['grid_minor'], linewidth=0.3, alpha=0.4, zorder=0)
-        for y in y_minor:
-            if y not in y_major:
-                ax.axhline(y, color=self.arch_colors['grid_minor'], linewidth=0.3, alpha=0.4, zorder=0)
+        # Skip minor lines that coincide with a major one
+        minor_style = dict(colors=self.arch_colors['grid_minor'], linewidths=0.3, alpha=0.4, zorder=0)
+        self._add_grid_lines(ax,
+                             np.setdiff1d(x_minor, x_major, assume_unique=True),
+                             np.setdiff1d(y_minor, y_major, assume_unique=True),
+                             minor_style)
+
+    def _add_grid_lines(self, ax, xs, ys, style):
+        """Draw full-height and full-width grid lines as one collection per axis"""
+        # Same blended transforms as axvline/axhline: data along one axis, axes fraction along the other
+        ax.add_collection(LineCollection([[(x, 0), (x, 1)] for x in xs],
+                                         transform=ax.get_xaxis_transform(), **style), autolim=False)
+        ax.add_collection(LineCollection([[(0, y), (1, y)] for y in ys],
+                                         transform=ax.get_yaxis_transform(), **style), autolim=False)
+        
+        # Keep the grid inside the autoscaled view like axvline/axhline do
+        if len(xs):
+            ax.update_datalim([(min(xs), ax.dataLim.y0), (max(xs), ax.dataLim.y0)], updatey=False)
+        if len(ys):
+            ax.update_datalim([(ax.dataLim.x0, min(ys)), (ax.dataLim.x0, max(ys))], updatex=False)
+        ax.autoscale_view()
 
     def _render_professional_walls(self, ax, walls):
         """Render walls with professional architectural standards"""
-        # Exterior walls (thickest)
-        for wall in walls['exterior']:
-            geom = wall['geometry']
-            x, y = geom.xy
-            ax.plot(x, y, color=self.arch_colors['walls_load_bearing'], 
-                   linewidth=self.line_weights['walls_exterior'], 
-                   solid_capstyle='round', zorder=5)
-        
-        # Load bearing walls
-        for wall in walls['load_bearing']:
-            geom = wall['geometry']
-            x, y = geom.xy
-            ax.plot(x, y, color=self.arch_colors['walls_load_bearing'], 
-                   linewidth=self.line_weights['walls_interior'], 
-                   solid_capstyle='round', zorder=4)
-        
-        # Interior partition walls
-        for wall in walls['interior']:
-            geom = wall['geometry']
-            x, y = geom.xy
-            ax.plot(x, y, color=self.arch_colors['walls_partition'], 
-                   linewidth=self.line_weights['walls_interior'], 
-                   solid_capstyle='round', zorder=3)
+        # Exterior walls (thickest), load bearing walls, then interior partitions
+        wall_styles = [
+            ('exterior', self.arch_colors['walls_load_bearing'], self.line_weights['walls_exterior'], 5),
+            ('load_bearing', self.arch_colors['walls_load_bearing'], self.line_weights['walls_interior'], 4),
+            ('interior', self.arch_colors['walls_partition'], self.line_weights['walls_interior'], 3)
+        ]
+        
+        # One collection per wall category instead of one Line2D per wall
+        for wall_kind, color, linewidth, zorder in wall_styles:
+            if not walls[wall_kind]:
+                continue
+            segments = [wall['_xy'] for wall in walls[wall_kind]]
+            ax.add_collection(LineCollection(segments, colors=color, linewidths=linewidth,
+                                             capstyle='round', zorder=zorder))
 
     def _render_architectural_openings(self, ax, openings):
         """Render doors and windows with architectural symbols"""
-        # Doors with swing arcs
-        for door in openings['doors']:
+        door_color = self.arch_colors['doors_main']
+        door_linewidth = self.line_weights['doors']
+        label_color = self.arch_colors['text_secondary']
+        
+        # Door geometry as flat arrays: hinge centers, radii and leaf end points in one pass
+        doors = openings['doors']
+        if doors:
+            centers = np.array([door['center'] for door in doors], dtype=np.float64).reshape(-1, 2)
+            radii = np.array([door['radius'] for door in doors], dtype=np.float64)
+            end_angles = np.radians([door['end_angle'] for door in doors])
+            leaf_ends = centers + radii[:, None] * np.column_stack([np.cos(end_angles), np.sin(end_angles)])
+            
+            # Door hinge points and leaf lines, one collection each
+            ax.add_collection(PatchCollection([Circle(center, 0.1) for center in centers],
+                                              facecolors=door_color, edgecolors=door_color, zorder=8))
+            ax.add_collection(LineCollection(np.stack([centers, leaf_ends], axis=1),
+                                             colors=door_color, linewidths=door_linewidth, zorder=7))
+        
+        # Door swing arcs and width annotations
+        for door in doors:
             center = door['center']
             radius = door['radius']
-            start_angle = door['start_angle']
-            end_angle = door['end_angle']
-            
-            # Door hinge point
-            hinge = Circle(center, 0.1, color=self.arch_colors['doors_main'], zorder=8)
-            ax.add_patch(hinge)
             
-            # Door swing arc
             swing = Arc(center, radius*2, radius*2, 
-                       angle=0, theta1=start_angle, theta2=end_angle,
-                       color=self.arch_colors['doors_main'], 
-                       linewidth=self.line_weights['doors'], zorder=7)
+                       angle=0, theta1=door['start_angle'], theta2=door['end_angle'],
+                       color=door_color, linewidth=door_linewidth, zorder=7)
             ax.add_patch(swing)
             
-            # Door leaf line
-            end_angle_rad = math.radians(end_angle)
-            leaf_end = (center[0] + radius * math.cos(end_angle_rad),
-                       center[1] + radius * math.sin(end_angle_rad))
-            ax.plot([center[0], leaf_end[0]], [center[1], leaf_end[1]], 
-                   color=self.arch_colors['doors_main'], 
-                   linewidth=self.line_weights['doors'], zorder=7)
-            
-            # Door width annotation
             ax.text(center[0], center[1] - radius - 0.5, f"{door['width']:.0f}cm", 
-                   ha='center', va='top', fontsize=8, 
-                   color=self.arch_colors['text_secondary'])
+                   ha='center', va='top', fontsize=8, color=label_color)
         
         # Windows with architectural representation
+        window_lines = []
+        sill_lines = []
+        offset = 0.1
         for window in openings['windows']:
-            geom = window['line']
-            x, y = geom.xy
-            
-            # Window line (thicker)
-            ax.plot(x, y, color=self.arch_colors['windows'], 
-                   linewidth=self.line_weights['windows'] * 2, 
-                   solid_capstyle='round', zorder=6)
+            xy = window['_xy']
             
             # Window sill lines (parallel)
-            offset = 0.1
             normal_angle = window['orientation'] + math.pi/2
-            offset_x = offset * math.cos(normal_angle)
-            offset_y = offset * math.sin(normal_angle)
+            normal = (offset * math.cos(normal_angle), offset * math.sin(normal_angle))
             
-            x_offset1 = [xi + offset_x for xi in x]
-            y_offset1 = [yi + offset_y for yi in y]
-            x_offset2 = [xi - offset_x for xi in x]
-            y_offset2 = [yi - offset_y for yi in y]
-            
-            ax.plot(x_offset1, y_offset1, color=self.arch_colors['windows'], 
-                   linewidth=self.line_weights['windows'], alpha=0.7, zorder=6)
-            ax.plot(x_offset2, y_offset2, color=self.arch_colors['windows'], 
-                   linewidth=self.line_weights['windows'], alpha=0.7, zorder=6)
+            window_lines.append(xy)
+            sill_lines.append(xy + normal)
+            sill_lines.append(xy - normal)
+        
+        if window_lines:
+            # Window line (thicker)
+            ax.add_collection(LineCollection(window_lines, colors=self.arch_colors['windows'],
+                                             linewidths=self.line_weights['windows'] * 2,
+                                             capstyle='round', zorder=6))
+            ax.add_collection(LineCollection(sill_lines, colors=self.arch_colors['windows'],
+                                             linewidths=self.line_weights['windows'],
+                                             alpha=0.7, zorder=6))
 
     def _render_intelligent_rooms(self, ax, spaces):
         """Render rooms with intelligent color coding and labels"""
@@ -666,38 +853,40 @@ class SophisticatedArchitecturalEngine:
             'public': '#E8F5E8',
             'service': '#FFF0F5'
         }
+        text_primary = self.arch_colors['text_primary']
+        text_secondary = self.arch_colors['text_secondary']
         
         for i, room in enumerate(spaces['rooms']):
-            geom = room['geometry']
             room_type = room['type']
             
             # Room fill
-            if hasattr(geom, 'exterior'):
-                x, y = geom.exterior.xy
+            xy = room['_exterior_xy']
+            if xy is not None:
+                x, y = xy[:, 0], xy[:, 1]
                 color = room_type_colors.get(room_type, '#F9F9F9')
                 ax.fill(x, y, color=color, alpha=0.6, zorder=1)
                 
                 # Room outline
-                ax.plot(x, y, color=self.arch_colors['text_secondary'], 
+                ax.plot(x, y, color=text_secondary, 
                        linewidth=0.8, alpha=0.8, zorder=2)
             
             # Room label with area
-            centroid = geom.centroid
-            area = geom.area
+            cx, cy = room['cx'], room['cy']
+            area = room['area']
             
             # Room name and area
             room_label = f"{room_type.title()}\n{area:.1f}m²"
             
             # Clickable room center
-            room_center = Circle((centroid.x, centroid.y), 0.8, 
+            room_center = Circle((cx, cy), 0.8, 
                                color=room_type_colors.get(room_type, '#F9F9F9'),
-                               edgecolor=self.arch_colors['text_primary'],
+                               edgecolor=text_primary,
                                linewidth=1.5, alpha=0.9, picker=True, zorder=10)
             ax.add_patch(room_center)
             
-            ax.text(centroid.x, centroid.y, room_label, 
+            ax.text(cx, cy, room_label, 
                    ha='center', va='center', fontsize=9, fontweight='bold',
-                   color=self.arch_colors['text_primary'], zorder=11)
+                   color=text_primary, zorder=11)
 
     def _render_circulation_network(self, ax, circulation):
         """Render circulation network with accessibility indicators"""
@@ -707,133 +896,131 @@ class SophisticatedArchitecturalEngine:
         graph = circulation['graph']
         nodes = circulation['nodes']
         
-        # Draw circulation paths
-        for edge in graph.edges(data=True):
-            node1, node2, data = edge
-            pos1 = nodes[node1]['position']
-            pos2 = nodes[node2]['position']
-            
-            # Path color based on accessibility
-            color = self.arch_colors['accessibility'] if data.get('accessible', False) else self.arch_colors['rooms_circulation']
-            linewidth = 3 if data.get('accessible', False) else 2
-            
-            ax.plot([pos1[0], pos2[0]], [pos1[1], pos2[1]], 
-                   color=color, linewidth=linewidth, alpha=0.7, 
-                   linestyle='--', zorder=8)
-            
-            # Door width annotation
-            mid_x = (pos1[0] + pos2[0]) / 2
-            mid_y = (pos1[1] + pos2[1]) / 2
-            door_width = data.get('door_width', 0)
-            if door_width > 0:
-                ax.text(mid_x, mid_y, f"{door_width:.0f}cm", 
-                       ha='center', va='center', fontsize=7,
-                       bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8),
-                       color=self.arch_colors['text_secondary'], zorder=9)
+        # Edge endpoints, door widths and accessibility as arrays, built once
+        edges = list(graph.edges(data=True))
+        if not edges:
+            return
+        pos1 = np.array([nodes[node1]['position'] for node1, _, _ in edges], dtype=np.float64)
+        pos2 = np.array([nodes[node2]['position'] for _, node2, _ in edges], dtype=np.float64)
+        widths = np.array([data.get('door_width', 0) for _, _, data in edges], dtype=np.float64)
+        accessible = np.array([bool(data.get('accessible', False)) for _, _, data in edges])
+        segments = np.stack([pos1, pos2], axis=1)
+        
+        # Draw circulation paths, one collection per accessibility style
+        for mask, color, linewidth in ((accessible, self.arch_colors['accessibility'], 3),
+                                       (~accessible, self.arch_colors['rooms_circulation'], 2)):
+            if mask.any():
+                ax.add_collection(LineCollection(segments[mask], colors=color, linewidths=linewidth,
+                                                 alpha=0.7, linestyles='--', zorder=8))
+        
+        # Door width annotations at the path midpoints, sharing one style
+        mids = 0.5 * (pos1 + pos2)
+        label_style = dict(ha='center', va='center', fontsize=7,
+                           bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8),
+                           color=self.arch_colors['text_secondary'], zorder=9)
+        for (mid_x, mid_y), door_width in zip(mids[widths > 0], widths[widths > 0]):
+            ax.text(mid_x, mid_y, f"{door_width:.0f}cm", **label_style)
 
     def _add_architectural_annotations(self, ax, floor_data):
         """Add professional architectural annotations"""
-        # Add text annotations from DXF
+        text_primary = self.arch_colors['text_primary']
+        
+        # Add text annotations from DXF, sharing one style
+        text_style = dict(color=text_primary, ha='center', va='center', zorder=12)
         for annotation in floor_data['annotations']['text']:
             pos = annotation['position']
-            text = annotation['text']
-            height = annotation['height']
-            rotation = annotation['rotation']
-            
-            ax.text(pos[0], pos[1], text, 
-                   fontsize=max(8, height), rotation=rotation,
-                   color=self.arch_colors['text_primary'], 
-                   ha='center', va='center', zorder=12)
-        
-        # Add north arrow
-        self._add_north_arrow(ax)
+            ax.text(pos[0], pos[1], annotation['text'],
+                    fontsize=max(8, annotation['height']), rotation=annotation['rotation'],
+                    **text_style)
         
-        # Add scale bar
-        self._add_scale_bar(ax)
-
-    def _add_north_arrow(self, ax):
-        """Add professional north arrow"""
+        # Anchor the overlays from the current view limits, read once
         xlim = ax.get_xlim()
         ylim = ax.get_ylim()
         
-        # Position in top-right corner
-        arrow_x = xlim[1] - (xlim[1] - xlim[0]) * 0.05
-        arrow_y = ylim[1] - (ylim[1] - ylim[0]) * 0.05
+        # Add north arrow
+        self._add_north_arrow(ax, xlim, ylim)
         
-        # North arrow
-        arrow = patches.FancyArrowPatch((arrow_x, arrow_y - 2), (arrow_x, arrow_y),
-                                      arrowstyle='->', mutation_scale=20,
-                                      color=self.arch_colors['text_primary'],
-                                      linewidth=2, zorder=15)
+        # Add scale bar
+        self._add_scale_bar(ax, xlim, ylim)
+
+    def _add_north_arrow(self, ax, xlim, ylim):
+        """Add professional north arrow, pinned to the top-right corner of the axes"""
+        # Sized in data units for the initial view, placed in axes coordinates so it
+        # stays in the corner without recomputation when the view zooms
+        arrow_height = 2 / (ylim[1] - ylim[0])
+        label_dx = 0.5 / (xlim[1] - xlim[0])
+        text_primary = self.arch_colors['text_primary']
+        
+        # North arrow as one static polyline: stem, then an open head retraced through the
+        # tip, with the former '->' arrow style's point sizes fixed against the axes size
+        pt_x = ax.figure.dpi / 72 / ax.bbox.width
+        pt_y = ax.figure.dpi / 72 / ax.bbox.height
+        base_y = 0.95 - arrow_height + 2 * pt_y
+        tip_y = 0.95 - 4.24 * pt_y
+        head_x = 4 * pt_x
+        head_y = tip_y - 8 * pt_y
+        arrow = patches.Polygon([(0.95, base_y), (0.95, tip_y), (0.95 - head_x, head_y),
+                                 (0.95, tip_y), (0.95 + head_x, head_y)],
+                                closed=False, fill=False, edgecolor=text_primary, linewidth=2,
+                                joinstyle='round', capstyle='round', zorder=15, transform=ax.transAxes)
         ax.add_patch(arrow)
         
-        ax.text(arrow_x + 0.5, arrow_y - 1, 'N', fontsize=14, fontweight='bold',
-               color=self.arch_colors['text_primary'], zorder=15)
+        ax.text(0.95 + label_dx, 0.95 - arrow_height / 2, 'N', fontsize=14, fontweight='bold',
+               color=text_primary, zorder=15, transform=ax.transAxes)
 
-    def _add_scale_bar(self, ax):
+    def _add_scale_bar(self, ax, xlim, ylim):
         """Add professional scale bar"""
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-        
         # Position in bottom-left corner
         scale_x = xlim[0] + (xlim[1] - xlim[0]) * 0.05
         scale_y = ylim[0] + (ylim[1] - ylim[0]) * 0.05
         
         # 5m scale bar
         scale_length = 5.0
+        text_primary = self.arch_colors['text_primary']
         
-        # Scale bar line
-        ax.plot([scale_x, scale_x + scale_length], [scale_y, scale_y],
-               color=self.arch_colors['text_primary'], linewidth=3, zorder=15)
-        
-        # Scale bar ticks
-        ax.plot([scale_x, scale_x], [scale_y - 0.2, scale_y + 0.2],
-               color=self.arch_colors['text_primary'], linewidth=2, zorder=15)
-        ax.plot([scale_x + scale_length, scale_x + scale_length], [scale_y - 0.2, scale_y + 0.2],
-               color=self.arch_colors['text_primary'], linewidth=2, zorder=15)
+        # Scale bar line and end ticks as one collection
+        ax.add_collection(LineCollection([[(scale_x, scale_y), (scale_x + scale_length, scale_y)],
+                                          [(scale_x, scale_y - 0.2), (scale_x, scale_y + 0.2)],
+                                          [(scale_x + scale_length, scale_y - 0.2),
+                                           (scale_x + scale_length, scale_y + 0.2)]],
+                                         colors=text_primary,
+                                         linewidths=[3, 2, 2], capstyle='projecting', zorder=15))
         
         # Scale label
         ax.text(scale_x + scale_length/2, scale_y - 0.8, '5m',
                ha='center', va='top', fontsize=10, fontweight='bold',
-               color=self.arch_colors['text_primary'], zorder=15)
+               color=text_primary, zorder=15)
 
-    def _create_navigation_panel(self, ax, building_data):
+    def _create_navigation_panel(self, ax, snap):
         """Create interactive navigation panel"""
         ax.set_title('Navigation', fontweight='bold')
         
-        # Room list with navigation buttons
-        floor_data = building_data['floors'][self.current_floor]
-        rooms = floor_data['spaces']['rooms']
+        # Button labels for the first 10 rooms, built in one pass from the area column
+        shown = snap.rooms[:10]
+        labels = [f"{room['type'].title()}\n{area:.1f}m²"
+                  for room, area in zip(shown, snap.room_areas[:len(shown)].tolist())]
+        y_positions = 0.9 - 0.15 * np.arange(len(labels))
+        button_style = dict(boxstyle='round,pad=0.3', facecolor='lightblue', alpha=0.7)
         
-        y_pos = 0.9
-        for i, room in enumerate(rooms[:10]):  # Show first 10 rooms
-            room_type = room['type']
-            area = room['geometry'].area
-            
+        for label, y_pos in zip(labels, y_positions.tolist()):
             # Room button
-            button_text = f"{room_type.title()}\n{area:.1f}m²"
-            ax.text(0.1, y_pos, button_text, transform=ax.transAxes,
-                   fontsize=9, ha='left', va='top',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='lightblue', alpha=0.7))
-            
-            y_pos -= 0.15
+            ax.text(0.1, y_pos, label, transform=ax.transAxes,
+                   fontsize=9, ha='left', va='top', bbox=button_style)
         
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.set_xticks([])
         ax.set_yticks([])
 
-    def _create_info_panel(self, ax, building_data):
+    def _create_info_panel(self, ax, snap):
         """Create information panel with building statistics"""
         ax.set_title('Building Info', fontweight='bold')
         
-        floor_data = building_data['floors'][self.current_floor]
-        
         # Calculate statistics
-        total_rooms = len(floor_data['spaces']['rooms'])
-        total_area = sum(room['geometry'].area for room in floor_data['spaces']['rooms'])
-        total_doors = len(floor_data['openings']['doors'])
-        total_windows = len(floor_data['openings']['windows'])
+        total_rooms = len(snap.rooms)
+        total_area = float(snap.room_areas.sum())
+        total_doors = len(snap.doors)
+        total_windows = len(snap.windows)
         
         info_text = f"""Floor: {self.current_floor}
 Rooms: {total_rooms}
@@ -880,54 +1067,125 @@ Building Code: ✓"""
 
     def _setup_sophisticated_interactivity(self, fig, ax_main, building_data):
         """Setup sophisticated interactive features"""
+        # Highlights are animated overlays blitted over a cached plan background, so a
+        # click doesn't re-composite every wall, room and annotation
+        highlights = []
+        self._highlight_patch = None
+        self._bg = None
+        
+        # Initial view, restored on reset without re-running autoscale
+        self._base_xlim = ax_main.get_xlim()
+        self._base_ylim = ax_main.get_ylim()
+        
+        def on_draw(event):
+            # Full redraws (zoom, reset, resize) refresh the cached background; savefig
+            # renders at its own dpi and draws animated artists itself
+            if fig.canvas.is_saving():
+                return
+            self._bg = fig.canvas.copy_from_bbox(ax_main.bbox)
+            for artist in highlights:
+                ax_main.draw_artist(artist)
         
         def on_click(event):
             if event.inaxes == ax_main and event.dblclick:
                 # Double-click to navigate to room
                 click_point = Point(event.xdata, event.ydata)
                 
-                floor_data = building_data['floors'][self.current_floor]
-                for i, room in enumerate(floor_data['spaces']['rooms']):
-                    if room['geometry'].contains(click_point):
-                        self.active_room = i
-                        print(f"Navigated to: {room['type']} ({room['geometry'].area:.1f}m²)")
-                        # Highlight selected room
-                        self._highlight_room(ax_main, room)
-                        fig.canvas.draw()
-                        break
+                snap = self._get_snapshot(self.current_floor, building_data)
+                
+                # Bounding-box candidates, then the exact test on prepared geometries;
+                # the lowest index wins, as in a scan of the room list
+                candidates = np.sort(snap.tree.query(click_point))
+                hits = candidates[shapely.contains(snap.room_geoms[candidates], click_point)]
+                if len(hits):
+                    i = int(hits[0])
+                    room = snap.rooms[i]
+                    self.active_room = i
+                    print(f"Navigated to: {room['type']} ({room['area']:.1f}m²)")
+                    # Highlight selected room
+                    if self._highlight_room(ax_main, room) and not highlights:
+                        highlights.append(self._highlight_patch)
+                    if self._bg is None:
+                        fig.canvas.draw_idle()
+                    else:
+                        fig.canvas.restore_region(self._bg)
+                        for artist in highlights:
+                            ax_main.draw_artist(artist)
+                        fig.canvas.blit(ax_main.bbox)
+        
+        # Wheel ticks accumulate into one pending zoom that a short single-shot timer
+        # applies, so a fast scroll costs one redraw per frame rather than one per tick
+        self._pending_zoom = None
+        zoom_timer = fig.canvas.new_timer(interval=16)
+        zoom_timer.single_shot = True
+        
+        def apply_zoom():
+            center_x, center_y, zoom_factor = self._pending_zoom
+            self._pending_zoom = None
+            self._zoom_view(ax_main, center_x, center_y, zoom_factor)
+            fig.canvas.draw_idle()
+        
+        zoom_timer.add_callback(apply_zoom)
         
         def on_scroll(event):
             if event.inaxes == ax_main:
-                # Zoom with mouse wheel
+                # Zoom with mouse wheel; a zoom only depends on its last center, so
+                # coalesced ticks multiply their factors around the latest position
                 zoom_factor = 1.1 if event.button == 'up' else 0.9
-                self._zoom_view(ax_main, event.xdata, event.ydata, zoom_factor)
-                fig.canvas.draw()
+                if self._pending_zoom is None:
+                    self._pending_zoom = (event.xdata, event.ydata, zoom_factor)
+                    zoom_timer.start()
+                else:
+                    self._pending_zoom = (event.xdata, event.ydata, self._pending_zoom[2] * zoom_factor)
         
         def on_key(event):
             if event.key == 'r':
                 # Reset view
-                ax_main.autoscale()
-                fig.canvas.draw()
+                ax_main.set_xlim(self._base_xlim)
+                ax_main.set_ylim(self._base_ylim)
+                fig.canvas.draw_idle()
             elif event.key == 'up':
                 # Go up floor
                 self.current_floor += 1
+                if self.current_floor in building_data['floors']:
+                    self._get_snapshot(self.current_floor, building_data)
                 print(f"Switched to floor: {self.current_floor}")
             elif event.key == 'down':
                 # Go down floor
                 self.current_floor = max(0, self.current_floor - 1)
+                if self.current_floor in building_data['floors']:
+                    self._get_snapshot(self.current_floor, building_data)
                 print(f"Switched to floor: {self.current_floor}")
         
         # Connect events
+        fig.canvas.mpl_connect('draw_event', on_draw)
         fig.canvas.mpl_connect('button_press_event', on_click)
         fig.canvas.mpl_connect('scroll_event', on_scroll)
         fig.canvas.mpl_connect('key_press_event', on_key)
 
+    def _get_snapshot(self, floor, building_data):
+        """Snapshot of a floor's rooms, prepared geometries, STRtree and openings, built on first use"""
+        if floor not in self._snapshots:
+            floor_data = building_data['floors'][floor]
+            rooms = floor_data['spaces']['rooms']
+            room_geoms = np.array([room['geometry'] for room in rooms], dtype=object)
+            shapely.prepare(room_geoms)
+            self._snapshots[floor] = _FloorSnapshot(rooms, room_geoms, floor_data['spaces']['areas'],
+                                                    STRtree(room_geoms), floor_data['openings']['doors'],
+                                                    floor_data['openings']['windows'])
+        return self._snapshots[floor]
+
     def _highlight_room(self, ax, room):
-        """Highlight selected room"""
-        geom = room['geometry']
-        if hasattr(geom, 'exterior'):
-            x, y = geom.exterior.xy
-            ax.fill(x, y, color='yellow', alpha=0.5, zorder=20)
+        """Move the single animated highlight patch onto the selected room"""
+        xy = room['_exterior_xy']
+        if xy is None:
+            return False
+        if self._highlight_patch is None:
+            self._highlight_patch = ax.add_patch(patches.Polygon(xy, closed=True, color='yellow', alpha=0.5,
+                                                                 zorder=20, animated=True))
+        else:
+            self._highlight_patch.set_xy(xy)
+        return True
 
     def _zoom_view(self, ax, center_x, center_y, zoom_factor):
         """Zoom view around point"""
@@ -1,7 +1,11 @@
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import Arc, Circle, Rectangle, Polygon as MplPolygon
+from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 import numpy as np
+import shapely
 from shapely.geometry import Polygon, LineString, Point
 import math
 
@@ -18,6 +22,9 @@ class PixelPerfectRenderer:
             'legend_bg': '#F9FAFB'
         }
         
+        # Resolve the palette to RGBA tuples once rather than parsing hex on every draw call
+        self.colors = {name: to_rgba(color) for name, color in self.colors.items()}
+        
         self.line_weights = {
             'walls': 3.0,
             'restricted': 1.5,
@@ -33,14 +40,54 @@ class PixelPerfectRenderer:
             'labels': {'size': 10, 'weight': 'normal'},
             'measurements': {'size': 8, 'weight': 'normal'}
         }
+        
+        # Label styles shared by every îlot and corridor label
+        self._ilot_text_kw = dict(ha='center', va='center',
+                                  fontsize=self.fonts['measurements']['size'],
+                                  fontweight=self.fonts['measurements']['weight'],
+                                  color=self.colors['text'],
+                                  zorder=11)
+        self._corridor_text_kw = dict(ha='center', va='center',
+                                      fontsize=self.fonts['labels']['size'],
+                                      fontweight=self.fonts['labels']['weight'],
+                                      color=self.colors['text'],
+                                      bbox=dict(boxstyle='round,pad=0.3',
+                                                facecolor=self.colors['background'],
+                                                edgecolor=self.colors['corridors'],
+                                                alpha=0.8),
+                                      zorder=12)
+        
+        # Per-item styles for door swings, dimension labels and legend entries
+        self._swing_arc_kw = dict(angle=0,
+                                  color=self.colors['entrances'],
+                                  linewidth=self.line_weights['entrances'],
+                                  alpha=0.7,
+                                  zorder=7)
+        self._dimension_text_kw = dict(ha='center', va='center',
+                                       fontsize=self.fonts['measurements']['size'],
+                                       fontweight=self.fonts['measurements']['weight'],
+                                       color=self.colors['text'],
+                                       bbox=dict(boxstyle='round,pad=0.2',
+                                                 facecolor=self.colors['background'],
+                                                 edgecolor='none',
+                                                 alpha=0.8),
+                                       zorder=16)
+        self._legend_text_kw = dict(ha='left', va='center',
+                                    fontsize=self.fonts['legend']['size'],
+                                    fontweight=self.fonts['legend']['weight'],
+                                    color=self.colors['text'],
+                                    zorder=21)
     
     def render_pixel_perfect_plan(self, geometry_data, layout_data, output_path, 
-                                 title="Professional Floor Plan", dpi=300):
+                                 title="Professional Floor Plan", dpi=300, fast=True):
         """Render pixel-perfect floor plan with professional styling"""
         
         fig_size, plot_bounds = self._calculate_optimal_layout(geometry_data, layout_data)
         
-        fig, ax = plt.subplots(1, 1, figsize=fig_size, dpi=dpi)
+        # Figure on its own Agg canvas, outside pyplot's global figure registry
+        fig = Figure(figsize=fig_size, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
         
         self._setup_professional_styling(ax, plot_bounds)
         
@@ -58,9 +105,8 @@ class PixelPerfectRenderer:
         self._add_interactive_legend(ax, layout_data)
         self._add_title_and_branding(ax, title, layout_data.get('stats', {}))
         
-        self._save_high_quality_output(fig, output_path, dpi)
+        self._save_high_quality_output(fig, output_path, dpi, fast)
         
-        plt.close(fig)
         return output_path
     
     def _calculate_optimal_layout(self, geometry_data, layout_data):
@@ -121,19 +167,22 @@ class PixelPerfectRenderer:
         min_x, min_y, max_x, max_y = plot_bounds
         grid_spacing = 1.0
         
-        x = math.ceil(min_x / grid_spacing) * grid_spacing
-        while x <= max_x:
-            ax.axvline(x, color=self.colors['grid'], 
-                      linewidth=self.line_weights['grid'], 
-                      alpha=0.3, zorder=0)
-            x += grid_spacing
-        
-        y = math.ceil(min_y / grid_spacing) * grid_spacing
-        while y <= max_y:
-            ax.axhline(y, color=self.colors['grid'], 
-                      linewidth=self.line_weights['grid'], 
-                      alpha=0.3, zorder=0)
-            y += grid_spacing
+        # Grid positions in one pass; lines span the plot bounds the axes limits are set to
+        xs = np.arange(math.ceil(min_x / grid_spacing), math.floor(max_x / grid_spacing) + 1) * grid_spacing
+        ys = np.arange(math.ceil(min_y / grid_spacing), math.floor(max_y / grid_spacing) + 1) * grid_spacing
+        
+        vertical = np.stack([np.column_stack([xs, np.full_like(xs, min_y)]),
+                             np.column_stack([xs, np.full_like(xs, max_y)])], axis=1)
+        horizontal = np.stack([np.column_stack([np.full_like(ys, min_x), ys]),
+                               np.column_stack([np.full_like(ys, max_x), ys])], axis=1)
+        
+        for segments in (vertical, horizontal):
+            ax.add_collection(LineCollection(segments,
+                                             colors=self.colors['grid'],
+                                             linewidths=self.line_weights['grid'],
+                                             capstyle='projecting',
+                                             alpha=0.3,
+                                             zorder=0))
     
     def _render_building_envelope(self, ax, geometry_data):
         """Render building envelope outline"""
@@ -156,50 +205,76 @@ class PixelPerfectRenderer:
         """Render walls as thick gray lines"""
         
         wall_data = geometry_data.get('walls', {})
-        wall_polygons = wall_data.get('polygons', [])
+        wall_polygons = self._drawable_polygons(ax, wall_data.get('polygons', []))
         
-        for wall_poly in wall_polygons:
-            if wall_poly.is_empty:
-                continue
-            
-            if hasattr(wall_poly, 'exterior'):
-                coords = list(wall_poly.exterior.coords)
-                wall_patch = MplPolygon(coords,
-                                      facecolor=self.colors['walls'],
-                                      edgecolor=self.colors['walls'],
-                                      linewidth=self.line_weights['walls'],
-                                      alpha=0.8,
-                                      zorder=5)
-                ax.add_patch(wall_patch)
-                
-                for interior in wall_poly.interiors:
-                    hole_coords = list(interior.coords)
-                    hole_patch = MplPolygon(hole_coords,
-                                          facecolor=self.colors['background'],
-                                          edgecolor=self.colors['walls'],
-                                          linewidth=self.line_weights['walls'] * 0.5,
-                                          zorder=6)
-                    ax.add_patch(hole_patch)
+        if not wall_polygons:
+            return
+        
+        # Exterior and interior rings of every wall, read from GEOS in one call; each
+        # wall's exterior comes first among its rings
+        rings, owners = shapely.get_rings(wall_polygons, return_index=True)
+        is_exterior = np.r_[True, owners[1:] != owners[:-1]]
+        
+        ax.add_collection(PolyCollection(self._ring_verts(rings[is_exterior]),
+                                         facecolors=self.colors['walls'],
+                                         edgecolors=self.colors['walls'],
+                                         linewidths=self.line_weights['walls'],
+                                         joinstyle='miter',
+                                         alpha=0.8,
+                                         zorder=5))
+        
+        hole_verts = self._ring_verts(rings[~is_exterior])
+        if hole_verts:
+            ax.add_collection(PolyCollection(hole_verts,
+                                             facecolors=self.colors['background'],
+                                             edgecolors=self.colors['walls'],
+                                             linewidths=self.line_weights['walls'] * 0.5,
+                                             joinstyle='miter',
+                                             zorder=6))
+    
+    def _drawable_polygons(self, ax, geometries):
+        """Non-empty geometries that have an exterior ring to draw and overlap the view"""
+        
+        polygons = [geom for geom in geometries if not geom.is_empty and hasattr(geom, 'exterior')]
+        return [polygon for polygon, visible in zip(polygons, self._in_view(ax, polygons)) if visible]
+    
+    def _in_view(self, ax, geometries):
+        """Whether each geometry's bounding box overlaps the axes limits, in one vectorized test"""
+        
+        if not geometries:
+            return []
+        (view_x0, view_x1), (view_y0, view_y1) = ax.get_xlim(), ax.get_ylim()
+        min_x, min_y, max_x, max_y = shapely.bounds(geometries).T
+        return ((max_x >= view_x0) & (min_x <= view_x1) &
+                (max_y >= view_y0) & (min_y <= view_y1)).tolist()
+    
+    def _ring_verts(self, rings):
+        """Vertex arrays of each ring, split from one GEOS coordinate read"""
+        
+        if not len(rings):
+            return []
+        coords, index = shapely.get_coordinates(rings, return_index=True)
+        return np.split(coords, np.cumsum(np.bincount(index, minlength=len(rings)))[:-1])
+    
+    def _exterior_verts(self, polygons):
+        """Vertex arrays of each polygon's exterior ring"""
+        
+        return self._ring_verts(shapely.get_exterior_ring(polygons))
     
     def _render_restricted_zones(self, ax, geometry_data):
         """Render restricted zones in blue"""
         
         restricted_data = geometry_data.get('restricted_zones', {})
-        restricted_polygons = restricted_data.get('polygons', [])
-        
-        for restricted_poly in restricted_polygons:
-            if restricted_poly.is_empty:
-                continue
-            
-            if hasattr(restricted_poly, 'exterior'):
-                coords = list(restricted_poly.exterior.coords)
-                restricted_patch = MplPolygon(coords,
-                                            facecolor=self.colors['restricted'],
-                                            edgecolor=self.colors['restricted'],
-                                            linewidth=self.line_weights['restricted'],
-                                            alpha=0.3,
-                                            zorder=3)
-                ax.add_patch(restricted_patch)
+        restricted_polygons = self._drawable_polygons(ax, restricted_data.get('polygons', []))
+        
+        if restricted_polygons:
+            ax.add_collection(PolyCollection(self._exterior_verts(restricted_polygons),
+                                             facecolors=self.colors['restricted'],
+                                             edgecolors=self.colors['restricted'],
+                                             linewidths=self.line_weights['restricted'],
+                                             joinstyle='miter',
+                                             alpha=0.3,
+                                             zorder=3))
     
     def _render_entrances_with_swings(self, ax, geometry_data):
         """Render entrances/exits in red with curved door swings"""
@@ -207,69 +282,66 @@ class PixelPerfectRenderer:
         entrance_data = geometry_data.get('entrances', {})
         entrance_points = entrance_data.get('points', [])
         
-        for entrance_point in entrance_points:
-            if isinstance(entrance_point, Point):
-                x, y = entrance_point.x, entrance_point.y
-                
-                entrance_circle = Circle((x, y), 0.3,
-                                       facecolor=self.colors['entrances'],
-                                       edgecolor=self.colors['entrances'],
-                                       linewidth=self.line_weights['entrances'],
-                                       alpha=0.8,
-                                       zorder=7)
-                ax.add_patch(entrance_circle)
-                
-                clearance_circle = Circle((x, y), 1.5,
-                                        facecolor='none',
-                                        edgecolor=self.colors['entrances'],
-                                        linewidth=self.line_weights['entrances'] * 0.5,
-                                        alpha=0.3,
-                                        linestyle='--',
-                                        zorder=2)
-                ax.add_patch(clearance_circle)
+        offsets = np.array([(point.x, point.y) for point in entrance_points if isinstance(point, Point)])
+        if not len(offsets):
+            return
+        
+        # Circles sized in data units, as the patches they replace
+        ax.add_collection(EllipseCollection(0.6, 0.6, 0, units='xy',
+                                            offsets=offsets,
+                                            offset_transform=ax.transData,
+                                            facecolors=self.colors['entrances'],
+                                            edgecolors=self.colors['entrances'],
+                                            linewidths=self.line_weights['entrances'],
+                                            alpha=0.8,
+                                            zorder=7))
+        
+        ax.add_collection(EllipseCollection(3.0, 3.0, 0, units='xy',
+                                            offsets=offsets,
+                                            offset_transform=ax.transData,
+                                            facecolors='none',
+                                            edgecolors=self.colors['entrances'],
+                                            linewidths=self.line_weights['entrances'] * 0.5,
+                                            alpha=0.3,
+                                            linestyles='--',
+                                            zorder=2))
     
     def _render_doors_with_swings(self, ax, geometry_data):
         """Render doors with swing directions"""
         
         door_data = geometry_data.get('doors', {})
-        doors = door_data.get('doors', [])
+        doors = [door for door in door_data.get('doors', []) if door.get('center')]
+        if not doors:
+            return
         
-        for door in doors:
-            center = door.get('center')
-            radius = door.get('radius', 0.9)
+        centers = np.array([door['center'] for door in doors], dtype=np.float64)
+        radii = np.array([door.get('radius', 0.9) for door in doors], dtype=np.float64)
+        end_angles = np.radians([door.get('end_angle', 90) for door in doors])
+        leaf_ends = centers + radii[:, None] * np.column_stack([np.cos(end_angles), np.sin(end_angles)])
+        
+        ax.add_collection(EllipseCollection(0.2, 0.2, 0, units='xy',
+                                            offsets=centers,
+                                            offset_transform=ax.transData,
+                                            facecolors=self.colors['entrances'],
+                                            edgecolors=self.colors['entrances'],
+                                            zorder=8))
+        
+        for door, (x, y), radius in zip(doors, centers.tolist(), radii.tolist()):
             start_angle = door.get('start_angle', 0)
             end_angle = door.get('end_angle', 90)
             
-            if not center:
-                continue
-            
-            x, y = center
-            
-            hinge_circle = Circle((x, y), 0.1,
-                                facecolor=self.colors['entrances'],
-                                edgecolor=self.colors['entrances'],
-                                zorder=8)
-            ax.add_patch(hinge_circle)
-            
             swing_arc = Arc((x, y), radius * 2, radius * 2,
-                          angle=0,
                           theta1=start_angle,
                           theta2=end_angle,
-                          color=self.colors['entrances'],
-                          linewidth=self.line_weights['entrances'],
-                          alpha=0.7,
-                          zorder=7)
+                          **self._swing_arc_kw)
             ax.add_patch(swing_arc)
-            
-            end_angle_rad = math.radians(end_angle)
-            leaf_x = x + radius * math.cos(end_angle_rad)
-            leaf_y = y + radius * math.sin(end_angle_rad)
-            
-            ax.plot([x, leaf_x], [y, leaf_y],
-                   color=self.colors['entrances'],
-                   linewidth=self.line_weights['entrances'],
-                   alpha=0.7,
-                   zorder=7)
+        
+        ax.add_collection(LineCollection(np.stack([centers, leaf_ends], axis=1),
+                                         colors=self.colors['entrances'],
+                                         linewidths=self.line_weights['entrances'],
+                                         capstyle='projecting',
+                                         alpha=0.7,
+                                         zorder=7))
     
     def _render_windows(self, ax, geometry_data):
         """Render windows"""
@@ -297,66 +369,53 @@ class PixelPerfectRenderer:
         categories = layout_data.get('categories', {})
         
         for category_name, category_data in categories.items():
-            islands = category_data.get('islands', [])
+            islands = self._drawable_polygons(ax, category_data.get('islands', []))
             color = category_data.get('color', '#22C55E')
             outline_color = category_data.get('outline', '#16A34A')
             
-            for island in islands:
-                if island.is_empty:
-                    continue
-                
-                if hasattr(island, 'exterior'):
-                    coords = list(island.exterior.coords)
-                    island_patch = MplPolygon(coords,
-                                            facecolor=color,
-                                            edgecolor=outline_color,
-                                            linewidth=self.line_weights['outline'],
-                                            alpha=0.7,
-                                            zorder=10)
-                    ax.add_patch(island_patch)
-                    
-                    centroid = island.centroid
-                    area = island.area
-                    ax.text(centroid.x, centroid.y, f'{area:.1f}m²',
-                           ha='center', va='center',
-                           fontsize=self.fonts['measurements']['size'],
-                           fontweight=self.fonts['measurements']['weight'],
-                           color=self.colors['text'],
-                           zorder=11)
+            if not islands:
+                continue
+            
+            ax.add_collection(PolyCollection(self._exterior_verts(islands),
+                                             facecolors=color,
+                                             edgecolors=outline_color,
+                                             linewidths=self.line_weights['outline'],
+                                             joinstyle='miter',
+                                             alpha=0.7,
+                                             zorder=10))
+            
+            # Label anchors and areas for the whole category in two GEOS calls
+            centroids = shapely.get_coordinates(shapely.centroid(islands))
+            labels = np.char.mod('%.1fm²', shapely.area(islands))
+            
+            for (centroid_x, centroid_y), label in zip(centroids.tolist(), labels.tolist()):
+                ax.text(centroid_x, centroid_y, label, **self._ilot_text_kw)
     
     def _render_corridor_network(self, ax, layout_data):
         """Render corridor network with area labels"""
         
-        corridors = layout_data.get('corridors', [])
-        
-        for i, corridor in enumerate(corridors):
-            corridor_geom = corridor.get('geometry')
+        corridors = [corridor for corridor in layout_data.get('corridors', [])
+                     if corridor.get('geometry') and not corridor['geometry'].is_empty
+                     and hasattr(corridor['geometry'], 'exterior')]
+        visible = self._in_view(ax, [corridor['geometry'] for corridor in corridors])
+        corridors = [corridor for corridor, in_view in zip(corridors, visible) if in_view]
+        corridor_geoms = [corridor['geometry'] for corridor in corridors]
+        
+        if corridors:
+            ax.add_collection(PolyCollection(self._exterior_verts(corridor_geoms),
+                                             facecolors=self.colors['corridors'],
+                                             edgecolors=self.colors['corridors'],
+                                             linewidths=self.line_weights['corridors'],
+                                             joinstyle='miter',
+                                             alpha=0.4,
+                                             zorder=4))
+        
+        centroids = shapely.get_coordinates(shapely.centroid(corridor_geoms))
+        
+        for corridor, (centroid_x, centroid_y) in zip(corridors, centroids.tolist()):
             corridor_area = corridor.get('area', 0)
             
-            if not corridor_geom or corridor_geom.is_empty:
-                continue
-            
-            if hasattr(corridor_geom, 'exterior'):
-                coords = list(corridor_geom.exterior.coords)
-                corridor_patch = MplPolygon(coords,
-                                          facecolor=self.colors['corridors'],
-                                          edgecolor=self.colors['corridors'],
-                                          linewidth=self.line_weights['corridors'],
-                                          alpha=0.4,
-                                          zorder=4)
-                ax.add_patch(corridor_patch)
-                
-                centroid = corridor_geom.centroid
-                ax.text(centroid.x, centroid.y, f'{corridor_area:.2f}m²',
-                       ha='center', va='center',
-                       fontsize=self.fonts['labels']['size'],
-                       fontweight=self.fonts['labels']['weight'],
-                       color=self.colors['text'],
-                       bbox=dict(boxstyle='round,pad=0.3',
-                               facecolor=self.colors['background'],
-                               edgecolor=self.colors['corridors'],
-                               alpha=0.8),
-                       zorder=12)
+            ax.text(centroid_x, centroid_y, f'{corridor_area:.2f}m²', **self._corridor_text_kw)
     
     def _add_measurements_and_annotations(self, ax, geometry_data, layout_data):
         """Add measurements and annotations"""
@@ -367,57 +426,56 @@ class PixelPerfectRenderer:
             width = bounds[2] - bounds[0]
             height = bounds[3] - bounds[1]
             
+            dimension_lines = []
+            dimension_ticks = []
+            
             self._add_dimension_line(ax, 
                                    (bounds[0], bounds[1] - 0.5),
                                    (bounds[2], bounds[1] - 0.5),
-                                   f'{width:.1f}m')
+                                   f'{width:.1f}m',
+                                   dimension_lines, dimension_ticks)
             
             self._add_dimension_line(ax,
                                    (bounds[0] - 0.5, bounds[1]),
                                    (bounds[0] - 0.5, bounds[3]),
                                    f'{height:.1f}m',
+                                   dimension_lines, dimension_ticks,
                                    vertical=True)
+            
+            ax.add_collection(LineCollection(dimension_lines,
+                                             colors=self.colors['text'],
+                                             linewidths=self.line_weights['grid'],
+                                             capstyle='projecting',
+                                             alpha=0.7,
+                                             zorder=15))
+            ax.add_collection(LineCollection(dimension_ticks,
+                                             colors=self.colors['text'],
+                                             linewidths=1,
+                                             capstyle='projecting',
+                                             zorder=15))
     
-    def _add_dimension_line(self, ax, start, end, label, vertical=False):
-        """Add dimension line with label"""
+    def _add_dimension_line(self, ax, start, end, label, lines, ticks, vertical=False):
+        """Add dimension line label, collecting its line and end tick segments"""
         
         x1, y1 = start
         x2, y2 = end
         
-        ax.plot([x1, x2], [y1, y2],
-               color=self.colors['text'],
-               linewidth=self.line_weights['grid'],
-               alpha=0.7,
-               zorder=15)
+        lines.append([(x1, y1), (x2, y2)])
         
         marker_size = 0.1
         if vertical:
-            ax.plot([x1 - marker_size, x1 + marker_size], [y1, y1],
-                   color=self.colors['text'], linewidth=1, zorder=15)
-            ax.plot([x2 - marker_size, x2 + marker_size], [y2, y2],
-                   color=self.colors['text'], linewidth=1, zorder=15)
+            ticks.append([(x1 - marker_size, y1), (x1 + marker_size, y1)])
+            ticks.append([(x2 - marker_size, y2), (x2 + marker_size, y2)])
         else:
-            ax.plot([x1, x1], [y1 - marker_size, y1 + marker_size],
-                   color=self.colors['text'], linewidth=1, zorder=15)
-            ax.plot([x2, x2], [y2 - marker_size, y2 + marker_size],
-                   color=self.colors['text'], linewidth=1, zorder=15)
+            ticks.append([(x1, y1 - marker_size), (x1, y1 + marker_size)])
+            ticks.append([(x2, y2 - marker_size), (x2, y2 + marker_size)])
         
         mid_x = (x1 + x2) / 2
         mid_y = (y1 + y2) / 2
         
         rotation = 90 if vertical else 0
         
-        ax.text(mid_x, mid_y, label,
-               ha='center', va='center',
-               fontsize=self.fonts['measurements']['size'],
-               fontweight=self.fonts['measurements']['weight'],
-               color=self.colors['text'],
-               rotation=rotation,
-               bbox=dict(boxstyle='round,pad=0.2',
-                       facecolor=self.colors['background'],
-                       edgecolor='none',
-                       alpha=0.8),
-               zorder=16)
+        ax.text(mid_x, mid_y, label, rotation=rotation, **self._dimension_text_kw)
     
     def _add_interactive_legend(self, ax, layout_data):
         """Add interactive legend matching color scheme"""
@@ -476,12 +534,7 @@ class PixelPerfectRenderer:
             
             ax.add_patch(indicator)
             
-            ax.text(legend_x - legend_width + 0.7, item_y, label,
-                   ha='left', va='center',
-                   fontsize=self.fonts['legend']['size'],
-                   fontweight=self.fonts['legend']['weight'],
-                   color=self.colors['text'],
-                   zorder=21)
+            ax.text(legend_x - legend_width + 0.7, item_y, label, **self._legend_text_kw)
     
     def _add_title_and_branding(self, ax, title, stats):
         """Add title and professional branding"""
@@ -524,11 +577,12 @@ class PixelPerfectRenderer:
                 f"Îlots Placed: {islands_placed}\n"
                 f"Corridors: {corridors_created}")
     
-    def _save_high_quality_output(self, fig, output_path, dpi):
+    def _save_high_quality_output(self, fig, output_path, dpi, fast=True):
         """Save high-quality output with proper settings"""
         
-        plt.tight_layout()
+        fig.tight_layout()
         
+        # PNG is lossless; the zlib level only trades file size for encode time
         fig.savefig(output_path,
                    dpi=dpi,
                    bbox_inches='tight',
@@ -536,12 +590,12 @@ class PixelPerfectRenderer:
                    facecolor=self.colors['background'],
                    edgecolor='none',
                    format='png',
-                   quality=95)
+                   pil_kwargs={'compress_level': 1 if fast else 6})
 
 def render_pixel_perfect_plan(geometry_data, layout_data, output_path, 
-                            title="Professional Floor Plan", dpi=300):
+                            title="Professional Floor Plan", dpi=300, fast=True):
     """Main rendering function"""
     renderer = PixelPerfectRenderer()
     return renderer.render_pixel_perfect_plan(
-        geometry_data, layout_data, output_path, title, dpi
+        geometry_data, layout_data, output_path, title, dpi, fast
     )
\ No newline at end of file